@@ -1,23 +1,23 @@
 import sys
 import os
 import re
-import json
+import functools
 import shutil
 import subprocess
+import time
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout,
-                             QHBoxLayout, QPushButton, QLabel, QFileDialog, QTextEdit, QMessageBox,
-                             QProgressBar, QGroupBox, QGridLayout, QCheckBox, QLineEdit, QSpinBox,
-                             QListWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject
+                             QHBoxLayout, QPushButton, QLabel, QFileDialog, QMessageBox,
+                             QProgressBar, QGroupBox, QGridLayout, QLineEdit, QSpinBox,
+                             QListWidget, QPlainTextEdit)
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, QSettings, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
 
 sys.path.insert(0, os.path.dirname(__file__))
-from coordinate_insertion import CoordinateInsertionWorker, insert_coordinates, validate_files, get_marker_path, create_coordinates_folder
-from pose_creation import PoseCreationWorker, insert_pose, validate_pose_name, get_existing_poses
-from visualization_control import VisualizationWorker, set_suspension_visibility, set_marker_visibility, get_visualization_controls, get_color_coding_info
-from optimumSheetParser import OptimumSheetParser
-from test_solidworks_connection import get_active_document_name, get_active_assembly_and_configuration
+from coordinate_insertion import create_coordinates_folder
+from pose_creation import PoseCreationWorker, insert_pose, validate_pose_name, create_pose_folder
+from visualization_control import set_suspension_visibility, set_marker_visibility, get_color_coding_info
 from draw_suspension import (
-    load_json, count_hardpoints, count_wheels,
+    suspension_total,
     draw_full_suspension, draw_front_suspension, draw_rear_suspension,
     set_all_suspension_visibility, set_front_suspension_visibility, set_rear_suspension_visibility,
     set_all_wheels_visibility, set_front_wheels_visibility, set_rear_wheels_visibility,
@@ -27,247 +27,215 @@ from draw_suspension import (
     set_marker_visibility_by_name,
     create_all_markers_with_worker, delete_all_markers_with_worker
 )
-from solidworks_release import release_solidworks_command_state
-from utils import get_resource_path, find_suspension_tools_exe
-
-
-class QtStream(QObject):
-    """Redirect stdout to a PyQt signal."""
-    text_written = pyqtSignal(str)
-
-    def write(self, text):
-        if text.strip():
-            self.text_written.emit(text.strip())
-
-    def flush(self):
-        pass
+from workers import LogBuffer, WorkerBase, capture_stdout
+from utils import (get_resource_path, find_suspension_tools_exe, dir_has_files, read_json, format_json,
+                   read_text_head, iter_output_blocks)
+
+# Skip per-entry icon and symlink probes, which are slow on network and synced drives
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
+# Status logs drop their oldest lines beyond this, so long sessions don't grow without bound
+MAX_LOG_LINES = 5000
+
+# Longest stop_loading() blocks the GUI thread waiting for a finished worker's thread to exit
+WORKER_EXIT_WAIT_MS = 500
+
+# Characters allowed in a pose name; compiled once rather than on each create_pose()
+POSE_NAME_RE = re.compile(r"^[a-zA-Z0-9_\- ]+$")
+
+# Shared by the tabs with a progress bar; set once per tab instead of on each widget
+OPERATION_TAB_STYLESHEET = """
+QLabel#StateLabel { font-weight: bold; color: #0066cc; }
+QPushButton#AbortButton { background-color: #ff6666; }
+"""
+
+
+def color_coding_stylesheet(selector, extra=""):
+    """Return one rule per colour-coded category, matching widgets named f"{selector}{prefix}"."""
+    rules = []
+    for prefix, info in get_color_coding_info().items():
+        r, g, b = info['rgb']
+        rules.append(f"{selector}{prefix} {{ background-color: rgb({r}, {g}, {b}); color: white; {extra}}}")
+    return "\n".join(rules)
+
+
+class ThrottledProgressBar(QProgressBar):
+    """Progress bar whose set_progress() skips repaints the user wouldn't notice.
+
+    An update is drawn when it moves the bar to a new 1/PROGRESS_STEPS step,
+    when MIN_REPAINT_INTERVAL has passed since the last one, or when it is the
+    final value.
+    """
+    PROGRESS_STEPS = 200
+    MIN_REPAINT_INTERVAL = 0.05  # seconds
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_step = -1
+        self._last_paint = 0.0
+
+    def set_progress(self, current, total):
+        """Show current/total, or an indeterminate bar while the total is unknown."""
+        if total <= 0:
+            if self.maximum() != 0:
+                self.setRange(0, 0)
+                self.setFormat("Working...")
+            return
+        if self.maximum() != total:
+            self.setRange(0, total)
+            self.setFormat("%v / %m (%p%)")
+            self._last_step = -1
+
+        step = current * self.PROGRESS_STEPS // total
+        now = time.monotonic()
+        if current != total and step == self._last_step and now - self._last_paint < self.MIN_REPAINT_INTERVAL:
+            return
+        self._last_step = step
+        self._last_paint = now
+        self.setValue(current)
 
 
 class SolidWorksWorker(QThread):
     """Worke.r thread for SolidWorks operations."""
     finished = pyqtSignal(bool, str)
     progress = pyqtSignal(int)
-    log = pyqtSignal(str)
+    total_ready = pyqtSignal(int)
+
+    # Progress is emitted in batches to limit cross-thread signal traffic
+    PROGRESS_BATCH = 8
+    PROGRESS_INTERVAL = 0.05  # seconds
 
-    def __init__(self, operation, total_count, *args):
+    def __init__(self, operation, count_fn, *args):
         super().__init__()
         self.operation = operation
-        self.total_count = total_count
+        self.count_fn = count_fn  # Computes the progress total off the GUI thread
         self.args = args
+        self.output = LogBuffer()  # Drained by the owning tab's timer
+        self._pending = 0
+        self._last_emit = time.monotonic()
 
     def progress_callback(self, count):
-        self.progress.emit(count)
+        self._pending += count
+        now = time.monotonic()
+        if self._pending >= self.PROGRESS_BATCH or now - self._last_emit >= self.PROGRESS_INTERVAL:
+            self._flush_progress(now)
+
+    def _flush_progress(self, now=None):
+        if self._pending:
+            self.progress.emit(self._pending)
+            self._pending = 0
+        self._last_emit = time.monotonic() if now is None else now
 
     def run(self):
-        # Redirect stdout to log signal for this thread
-        stream = QtStream()
-        stream.text_written.connect(self.log.emit)
-        old_stdout = sys.stdout
-        sys.stdout = stream
         try:
-            self.operation(*self.args, progress_callback=self.progress_callback)
-            self.finished.emit(True, "Suspension imported successfully")
+            # Send this thread's print() output to the log buffer
+            with capture_stdout(self.output):
+                if self.count_fn is not None:
+                    self.total_ready.emit(self.count_fn())
+                self.operation(*self.args, progress_callback=self.progress_callback)
+            success, message = True, "Suspension imported successfully"
         except Exception as e:
-            self.finished.emit(False, str(e))
+            success, message = False, str(e)
         finally:
-            sys.stdout = old_stdout
+            self.output.flush()
+        # Emit remaining progress before reporting completion
+        self._flush_progress()
+        self.finished.emit(success, message)
 
 
-class HardpointWorker(QThread):
+class HardpointWorker(WorkerBase):
     """Worker thread for hardpoint operations."""
+    STATE_DESCRIPTIONS = {
+        **WorkerBase.STATE_DESCRIPTIONS,
+        "LoadingJson": "Loading JSON data...",
+        "LoadingMarkerPart": "Loading marker part...",
+        "InsertingBodies": "Inserting marker bodies...",
+        "RenamingBodies": "Renaming bodies...",
+        "ApplyingColors": "Applying colors...",
+        "CreatingCoordinateSystems": "Creating coordinate systems...",
+        "CreatingHardpointsFolder": "Creating Hardpoints folder...",
+        "CreatingTransformsFolder": "Creating Transforms folder...",
+        "CreatingTransforms": "Creating transform features...",
+        "UpdatingSuppression": "Updating suppression...",
+        "Rebuilding": "Rebuilding model...",
+    }
+
+
+class MarkerWorker(WorkerBase):
+    """Worker thread for marker operations."""
+    STATE_DESCRIPTIONS = {
+        **WorkerBase.STATE_DESCRIPTIONS,
+        "LoadingMarker": "Reading marker file...",
+        "ScanningCoordSystems": "Scanning coordinate systems...",
+        "InsertingComponents": "Inserting markers...",
+        "MatingMarkers": "Mating markers...",
+        "PostProcessing": "Post-processing markers...",
+        "Cleanup": "Cleaning up...",
+    }
+
+
+class ExcelParseWorker(QThread):
+    """Worker thread that parses an OptimumK workbook into component JSON files."""
     finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(int, int)  # current, total
-    state_changed = pyqtSignal(str)  # state description
-    log = pyqtSignal(str)
+    progress = pyqtSignal(int, int)  # sheets parsed, total sheets
 
-    def __init__(self, operation, *args):
+    def __init__(self, excel_file, output_dir):
         super().__init__()
-        self.operation = operation
-        self.args = args
-        self._abort = False
-        self._process = None
-        self._total_tasks = 0
-        self._current_progress = 0
-
-    def abort(self):
-        """Request abort and terminate any running subprocess."""
-        self._abort = True
-        if self._process and self._process.poll() is None:
-            try:
-                self._process.terminate()
-                self._process.wait(timeout=2)
-            except:
-                try:
-                    self._process.kill()
-                except:
-                    pass
-
-        if self._process is not None:
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
-
-    def parse_output_line(self, line):
-        """Parse special output lines for progress and state."""
-        if line.startswith("TOTAL:"):
-            try:
-                new_total = int(line.split(":")[1])
-                # Always update to the latest total (may be refined during execution)
-                self._total_tasks = new_total
-                # Emit progress with updated total, keeping current progress
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
-                pass
-            return None  # Don't show in log
-        elif line.startswith("PROGRESS:"):
-            try:
-                self._current_progress = int(line.split(":")[1])
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
-                pass
-            return None  # Don't show in log
-        elif line.startswith("STATE:"):
-            state = line.split(":")[1]
-            state_descriptions = {
-                "Initializing": "Starting...",
-                "LoadingJson": "Loading JSON data...",
-                "LoadingMarkerPart": "Loading marker part...",
-                "InsertingBodies": "Inserting marker bodies...",
-                "RenamingBodies": "Renaming bodies...",
-                "ApplyingColors": "Applying colors...",
-                "CreatingCoordinateSystems": "Creating coordinate systems...",
-                "CreatingHardpointsFolder": "Creating Hardpoints folder...",
-                "CreatingTransformsFolder": "Creating Transforms folder...",
-                "CreatingTransforms": "Creating transform features...",
-                "UpdatingSuppression": "Updating suppression...",
-                "Rebuilding": "Rebuilding model...",
-                "Complete": "Done"
-            }
-            description = state_descriptions.get(state, state)
-            self.state_changed.emit(description)
-            return None  # Don't show in log
-        return line  # Normal log line
+        self.excel_file = excel_file
+        self.output_dir = output_dir
 
     def run(self):
-        stream = QtStream()
-        stream.text_written.connect(self._handle_log)
-        old_stdout = sys.stdout
-        sys.stdout = stream
         try:
-            result = self.operation(*self.args, worker=self)
-            if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(True, "Operation completed successfully")
+            # Deferred: openpyxl is slow to import and only needed here
+            from optimumSheetParser import OptimumSheetParser
+            parser = OptimumSheetParser(self.excel_file)
+            parser.parse(progress_callback=self.progress.emit)
+            parser.save_json_by_component(self.output_dir)
+            self.finished.emit(True, f"Component JSON files saved to:\n{self.output_dir}")
         except Exception as e:
-            if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(False, str(e))
-        finally:
-            sys.stdout = old_stdout
+            self.finished.emit(False, str(e))
 
-    def _handle_log(self, text):
-        """Handle log output, parsing special lines."""
-        result = self.parse_output_line(text)
-        if result is not None:
-            self.log.emit(result)
 
+class VisibilityWorker(QThread):
+    """Worker thread for a single visibility command."""
+    finished = pyqtSignal(bool)  # command succeeded
+    failed = pyqtSignal(object)  # exception raised by the command
 
-class MarkerWorker(QThread):
-    """Worker thread for marker operations."""
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(int, int)  # current, total
-    state_changed = pyqtSignal(str)  # state description
-    log = pyqtSignal(str)
+    def __init__(self, func, visible):
+        super().__init__()
+        self.func = func
+        self.visible = visible
 
-    def __init__(self, operation, *args):
+    def run(self):
+        try:
+            self.finished.emit(bool(self.func(self.visible)))
+        except Exception as e:
+            self.failed.emit(e)
+
+
+class CommandSignals(QObject):
+    """Signals for CommandRunnable (QRunnable is not a QObject)."""
+    finished = pyqtSignal(object, object)  # tag, return value
+    failed = pyqtSignal(object, object)    # tag, exception raised by the command
+
+
+class CommandRunnable(QRunnable):
+    """Run one short SuspensionTools command on a QThreadPool thread."""
+
+    def __init__(self, tag, func, *args):
         super().__init__()
-        self.operation = operation
+        self.tag = tag
+        self.func = func
         self.args = args
-        self._abort = False
-        self._process = None
-        self._total_tasks = 0
-        self._current_progress = 0
-
-    def abort(self):
-        """Request abort and terminate any running subprocess."""
-        self._abort = True
-        if self._process and self._process.poll() is None:
-            try:
-                self._process.terminate()
-                self._process.wait(timeout=2)
-            except:
-                try:
-                    self._process.kill()
-                except:
-                    pass
-
-        if self._process is not None:
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
-
-    def parse_output_line(self, line):
-        """Parse special output lines for progress and state."""
-        if line.startswith("TOTAL:"):
-            try:
-                new_total = int(line.split(":")[1])
-                # Always update to the latest total (may be refined during execution)
-                self._total_tasks = new_total
-                # Emit progress with updated total, keeping current progress
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
-                pass
-            return None  # Don't show in log
-        elif line.startswith("PROGRESS:"):
-            try:
-                self._current_progress = int(line.split(":")[1])
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
-                pass
-            return None  # Don't show in log
-        elif line.startswith("STATE:"):
-            state = line.split(":")[1]
-            state_descriptions = {
-                "Initializing": "Starting...",
-                "LoadingMarker": "Reading marker file...",
-                "ScanningCoordSystems": "Scanning coordinate systems...",
-                "InsertingComponents": "Inserting markers...",
-                "MatingMarkers": "Mating markers...",
-                "PostProcessing": "Post-processing markers...",
-                "Cleanup": "Cleaning up...",
-                "Complete": "Done"
-            }
-            description = state_descriptions.get(state, state)
-            self.state_changed.emit(description)
-            return None  # Don't show in log
-        return line  # Normal log line
+        self.signals = CommandSignals()
 
     def run(self):
-        stream = QtStream()
-        stream.text_written.connect(self._handle_log)
-        old_stdout = sys.stdout
-        sys.stdout = stream
         try:
-            result = self.operation(*self.args, worker=self)
-            if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(True, "Operation completed successfully")
+            result = self.func(*self.args)
         except Exception as e:
-            if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(False, str(e))
-        finally:
-            sys.stdout = old_stdout
-
-    def _handle_log(self, text):
-        """Handle log output, parsing special lines."""
-        result = self.parse_output_line(text)
-        if result is not None:
-            self.log.emit(result)
+            self.signals.failed.emit(self.tag, e)
+        else:
+            self.signals.finished.emit(self.tag, result)
 
 
 class ProjectTab(QWidget):
@@ -361,12 +329,14 @@ class ProjectTab(QWidget):
     # --- Browse helpers ---
 
     def browse_new_project_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
+        folder = QFileDialog.getExistingDirectory(self, "Select Destination Folder",
+                                                  options=FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly)
         if folder:
             self.new_project_path_label.setText(folder)
 
     def browse_load_project_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Project Folder")
+        folder = QFileDialog.getExistingDirectory(self, "Select Project Folder",
+                                                  options=FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly)
         if folder:
             self.load_project_path_label.setText(folder)
 
@@ -430,8 +400,16 @@ class ProjectTab(QWidget):
 
 
 class ImportOptimumKTab(QWidget):
+    # Files above this size are shown raw instead of parsed; the preview pane only shows the top.
+    PREVIEW_PARSE_LIMIT = 256 * 1024
+    PREVIEW_HEAD_BYTES = 64 * 1024
+
     def __init__(self):
         super().__init__()
+        self.settings = QSettings("OptimumK", "SolidworksOptKPlugin")
+        # Preview text keyed by path; reused while the file's mtime is unchanged
+        self._preview_cache: dict[str, tuple[int, str]] = {}
+        self.parse_worker = None
         self.init_ui()
 
     def init_ui(self):
@@ -451,16 +429,23 @@ class ImportOptimumKTab(QWidget):
         btn_browse_excel.clicked.connect(self.browse_excel_file)
         h_excel.addWidget(btn_browse_excel)
         
-        btn_parse_excel = QPushButton("Parse Excel")
-        btn_parse_excel.clicked.connect(self.parse_excel_file)
-        h_excel.addWidget(btn_parse_excel)
+        self.btn_parse_excel = QPushButton("Parse Excel")
+        self.btn_parse_excel.clicked.connect(self.parse_excel_file)
+        h_excel.addWidget(self.btn_parse_excel)
         
         layout.addLayout(h_excel)
+
+        # Parse progress (per sheet)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
         
         # JSON preview
         layout.addWidget(QLabel("JSON Preview (/temp):"))
-        self.json_preview = QTextEdit()
+        self.json_preview = QPlainTextEdit()
         self.json_preview.setReadOnly(True)
+        self.json_preview.setUndoRedoEnabled(False)
+        self.json_preview.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.json_preview.setMaximumHeight(200)
         layout.addWidget(self.json_preview)
         
@@ -469,7 +454,7 @@ class ImportOptimumKTab(QWidget):
         for i, name in enumerate(ProjectTab.COMPONENT_JSON_FILES):
             label = name.replace("_", " ").replace(".json", "")
             btn = QPushButton(f"Preview {label}")
-            btn.clicked.connect(lambda _checked=False, n=name: self.preview_json_file(n))
+            btn.clicked.connect(functools.partial(self.preview_json_file, name))
             grid_json.addWidget(btn, i // 3, i % 3)
         layout.addLayout(grid_json)
         
@@ -481,8 +466,11 @@ class ImportOptimumKTab(QWidget):
         self.setLayout(layout)
     
     def browse_excel_file(self):
-        file_path = QFileDialog.getOpenFileName(self, "Select Excel File", filter="*.xlsx *.xls")[0]
+        last_dir = self.settings.value("last_excel_dir", "")
+        file_path = QFileDialog.getOpenFileName(self, "Select Excel File", last_dir, "Excel (*.xlsx *.xls)",
+                                                options=FILE_DIALOG_OPTIONS)[0]
         if file_path:
+            self.settings.setValue("last_excel_dir", os.path.dirname(file_path))
             self.excel_file = file_path
             self.excel_path_label.setText(os.path.basename(file_path))
     
@@ -496,28 +484,39 @@ class ImportOptimumKTab(QWidget):
             QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
             return
 
-        try:
-            self.status_label.setText("Parsing Excel file...")
-            parser = OptimumSheetParser(self.excel_file)
-            parser.save_json_by_component(project_path)
+        self.status_label.setText("Parsing Excel file...")
+        # Indeterminate while the workbook loads; the worker reports sheets as they are parsed
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.btn_parse_excel.setEnabled(False)
+        self.parse_worker = ExcelParseWorker(self.excel_file, project_path)
+        self.parse_worker.progress.connect(self.on_parse_progress)
+        self.parse_worker.finished.connect(self.on_parse_finished)
+        self.parse_worker.start()
+
+    def on_parse_progress(self, done, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def on_parse_finished(self, success, message):
+        self.progress_bar.setVisible(False)
+        self.btn_parse_excel.setEnabled(True)
+        if success:
             self.status_label.setText("✓ Excel file parsed successfully")
-            QMessageBox.information(self, "Success",
-                                   f"Component JSON files saved to:\n{project_path}")
-        except Exception as e:
+            QMessageBox.information(self, "Success", message)
+        else:
             self.status_label.setText("✗ Parse failed")
-            QMessageBox.critical(self, "Error", f"Parse failed: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Parse failed: {message}")
     
-    def preview_json_file(self, filename):
+    def preview_json_file(self, filename, _checked=False):
         project_path = get_project_path(self)
         if not project_path:
             QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
             return
         full_path = os.path.join(project_path, filename)
         try:
-            with open(full_path, 'r') as f:
-                data = json.load(f)
-                self.json_preview.setText(json.dumps(data, indent=2))
-                self.status_label.setText(f"✓ Previewing {filename}")
+            self.json_preview.setPlainText(self._preview_text(full_path))
+            self.status_label.setText(f"✓ Previewing {filename}")
         except FileNotFoundError:
             QMessageBox.warning(self, "File Not Found",
                                 f"Could not find {filename}\n\nParse an Excel file first")
@@ -526,11 +525,42 @@ class ImportOptimumKTab(QWidget):
             QMessageBox.critical(self, "Error", f"Could not preview file: {str(e)}")
             self.status_label.setText("✗ Preview failed")
 
+    def _preview_text(self, full_path):
+        """Return preview text for a JSON file, formatting it only when it has changed."""
+        st = os.stat(full_path)
+        cached = self._preview_cache.get(full_path)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        if st.st_size > self.PREVIEW_PARSE_LIMIT:
+            text = read_text_head(full_path, self.PREVIEW_HEAD_BYTES) + "\n... (truncated)"
+        else:
+            text = format_json(read_json(full_path))
+        self._preview_cache[full_path] = (st.st_mtime_ns, text)
+        return text
+
 
 class WriteSolidworksTab(QWidget):
+    FRONT_JSON = "Front_Suspension.json"
+    REAR_JSON = "Rear_Suspension.json"
+    VEHICLE_JSON = "Vehicle_Setup.json"
+    # kind -> (operation, suspension files counted for progress, other required files)
+    IMPORT_OPS = {
+        "full": (draw_full_suspension, (FRONT_JSON, REAR_JSON), (VEHICLE_JSON,)),
+        "front": (draw_front_suspension, (FRONT_JSON,), ()),
+        "rear": (draw_rear_suspension, (REAR_JSON,), (VEHICLE_JSON,)),
+    }
+    LOG_POLL_MS = 100
+    # Repeated "Test Connection" clicks within this window reuse the last answer
+    CONNECTION_CACHE_SECONDS = 0.5
+
     def __init__(self):
         super().__init__()
         self.worker = None
+        self._doc_name_cache = None  # (time.monotonic() of lookup, document name)
+        # Worker output is polled rather than signalled per line
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(self.LOG_POLL_MS)
+        self.log_timer.timeout.connect(self._drain_log)
         self.init_ui()
     
     def init_ui(self):
@@ -557,140 +587,152 @@ class WriteSolidworksTab(QWidget):
         # Suspension import buttons
         layout.addWidget(QLabel("Import Suspension to SolidWorks:"))
 
+        # Shared container so the buttons are enabled/disabled in one call
+        self.import_buttons = QWidget()
+        v_import = QVBoxLayout(self.import_buttons)
+        v_import.setContentsMargins(0, 0, 0, 0)
+
         self.btn_import_full = QPushButton("Import Full Suspension")
-        self.btn_import_full.clicked.connect(self.import_full_suspension)
-        layout.addWidget(self.btn_import_full)
+        self.btn_import_full.clicked.connect(functools.partial(self._do_import, "full"))
+        v_import.addWidget(self.btn_import_full)
 
         self.btn_import_front = QPushButton("Import Front Suspension Only")
-        self.btn_import_front.clicked.connect(self.import_front_suspension)
-        layout.addWidget(self.btn_import_front)
+        self.btn_import_front.clicked.connect(functools.partial(self._do_import, "front"))
+        v_import.addWidget(self.btn_import_front)
 
         self.btn_import_rear = QPushButton("Import Rear Suspension Only")
-        self.btn_import_rear.clicked.connect(self.import_rear_suspension)
-        layout.addWidget(self.btn_import_rear)
+        self.btn_import_rear.clicked.connect(functools.partial(self._do_import, "rear"))
+        v_import.addWidget(self.btn_import_rear)
+
+        layout.addWidget(self.import_buttons)
 
         # Status / console output text box
         layout.addWidget(QLabel("Console Output:"))
-        self.status_text = QTextEdit()
+        # Line-based document keeps long import logs cheap to append to
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
-        self.status_text.setText("• Click 'Test Connection' to verify SolidWorks is running\n• Parse Excel file in Import tab first")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
+        self.status_text.setPlainText("• Click 'Test Connection' to verify SolidWorks is running\n• Parse Excel file in Import tab first")
         layout.addWidget(self.status_text)
 
         btn_clear = QPushButton("Clear")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
 
         layout.addStretch()
         self.setLayout(layout)
 
     def append_log(self, text):
-        self.status_text.append(text)
+        self.status_text.appendPlainText(text)
+
+    def _drain_log(self):
+        if self.worker is not None:
+            text = self.worker.output.drain()
+            if text:
+                self.append_log(text)
 
     def test_solidworks_connection(self):
         try:
-            doc_name = get_active_document_name()
+            now = time.monotonic()
+            if self._doc_name_cache is not None and now - self._doc_name_cache[0] < self.CONNECTION_CACHE_SECONDS:
+                doc_name = self._doc_name_cache[1]
+            else:
+                from test_solidworks_connection import get_active_document_name
+                doc_name = get_active_document_name()
+                self._doc_name_cache = (now, doc_name)
             self.connection_label.setText(f"✓ {doc_name}")
-            self.status_text.append(f"✓ Connected — Active document: {doc_name}")
+            self.status_text.appendPlainText(f"✓ Connected — Active document: {doc_name}")
         except Exception as e:
             self.connection_label.setText("✗ Not connected")
-            self.status_text.append(f"✗ Connection failed: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Connection failed: {str(e)}")
             QMessageBox.critical(self, "SolidWorks Connection Error",
                                  f"Could not connect to SolidWorks:\n\n{str(e)}\n\n"
                                  "Make sure:\n• SolidWorks is running\n• A document is open\n• pywin32 is installed")
 
     def set_buttons_enabled(self, enabled):
-        self.btn_import_full.setEnabled(enabled)
-        self.btn_import_front.setEnabled(enabled)
-        self.btn_import_rear.setEnabled(enabled)
+        self.import_buttons.setEnabled(enabled)
 
-    def start_loading(self, message, total_count):
-        self.progress_bar.setMaximum(total_count)
+    def start_loading(self, message):
+        # Indeterminate until the worker reports the total
+        self.progress_bar.setRange(0, 0)
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         self.set_buttons_enabled(False)
-        self.status_text.append(f"\n{message}")
+        self.status_text.appendPlainText(f"\n{message}")
+
+    def on_total_ready(self, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(0)
 
     def on_progress(self, count):
         self.progress_bar.setValue(self.progress_bar.value() + count)
 
     def stop_loading(self, success, message):
+        self.log_timer.stop()
+        self._drain_log()
         self.progress_bar.setVisible(False)
         self.set_buttons_enabled(True)
         if success:
-            self.status_text.append(f"✓ {message}")
+            self.status_text.appendPlainText(f"✓ {message}")
             QMessageBox.information(self, "Success", message)
         else:
-            self.status_text.append(f"✗ Error: {message}")
+            self.status_text.appendPlainText(f"✗ Error: {message}")
             QMessageBox.critical(self, "Error", f"Import failed: {message}")
 
-    def _start_worker(self, operation, total, *args):
-        self.start_loading(f"Running {operation.__name__}...", total)
-        self.worker = SolidWorksWorker(operation, total, *args)
-        self.worker.log.connect(self.append_log)
+    def _start_worker(self, operation, count_fn, *args):
+        """Run operation on a worker thread; count_fn runs there first to size the progress bar."""
+        self.start_loading(f"Running {operation.__name__}...")
+        self.worker = SolidWorksWorker(operation, count_fn, *args)
+        self.worker.total_ready.connect(self.on_total_ready)
         self.worker.progress.connect(self.on_progress)
         self.worker.finished.connect(self.stop_loading)
         self.worker.start()
+        self.log_timer.start()
 
-    def import_full_suspension(self):
+    def _project_files(self, *names):
+        """Return full paths for names in the project folder, or None if any is missing."""
         project_path = get_project_path(self)
         if not project_path:
             QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
-            return
-        front_file = os.path.join(project_path, "Front_Suspension.json")
-        rear_file = os.path.join(project_path, "Rear_Suspension.json")
-        vehicle_file = os.path.join(project_path, "Vehicle_Setup.json")
-
-        if not all(os.path.exists(f) for f in [front_file, rear_file, vehicle_file]):
+            return None
+        if not dir_has_files(project_path, names):
             QMessageBox.warning(self, "Missing Files", "Please parse an Excel file first")
+            return None
+        return [os.path.join(project_path, name) for name in names]
+
+    def _do_import(self, kind, _checked=False):
+        """Check the project files for an import kind and run it on a worker."""
+        # The import may change the active document
+        self._doc_name_cache = None
+        operation, counted, others = self.IMPORT_OPS[kind]
+        files = self._project_files(*counted, *others)
+        if files is None:
             return
+        counted_files = files[:len(counted)]
         try:
-            front_data, rear_data = load_json(front_file), load_json(rear_file)
-            total = (count_hardpoints(front_data) + count_wheels(front_data.get("Wheels", {})) +
-                     count_hardpoints(rear_data) + count_wheels(rear_data.get("Wheels", {})))
-            self._start_worker(draw_full_suspension, total, front_file, rear_file, vehicle_file)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-    def import_front_suspension(self):
-        project_path = get_project_path(self)
-        if not project_path:
-            QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
-            return
-        front_file = os.path.join(project_path, "Front_Suspension.json")
-        if not os.path.exists(front_file):
-            QMessageBox.warning(self, "Missing File", "Please parse an Excel file first")
-            return
-        try:
-            front_data = load_json(front_file)
-            total = count_hardpoints(front_data) + count_wheels(front_data.get("Wheels", {}))
-            self._start_worker(draw_front_suspension, total, front_file)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-    def import_rear_suspension(self):
-        project_path = get_project_path(self)
-        if not project_path:
-            QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
-            return
-        rear_file = os.path.join(project_path, "Rear_Suspension.json")
-        vehicle_file = os.path.join(project_path, "Vehicle_Setup.json")
-        if not all(os.path.exists(f) for f in [rear_file, vehicle_file]):
-            QMessageBox.warning(self, "Missing Files", "Please parse an Excel file first")
-            return
-        try:
-            rear_data = load_json(rear_file)
-            total = count_hardpoints(rear_data) + count_wheels(rear_data.get("Wheels", {}))
-            self._start_worker(draw_rear_suspension, total, rear_file, vehicle_file)
+            self._start_worker(operation,
+                               lambda: sum(suspension_total(f) for f in counted_files),
+                               *files)
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
 
 class ViewTab(QWidget):
     """Tab for controlling visibility of suspension features in SolidWorks."""
-    
+
+    # Clicks within this window are queued together; repeated clicks on one target keep only the last
+    VISIBILITY_DEBOUNCE_MS = 80
+
     def __init__(self):
         super().__init__()
+        self.vis_worker = None
+        self._pending = []  # (func, visible, description), run in click order
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.VISIBILITY_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._dispatch_visibility)
         self.init_ui()
     
     def init_ui(self):
@@ -704,38 +746,40 @@ class ViewTab(QWidget):
         layout.addWidget(btn_test_connection)
         
         # Status/console output
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
         self.status_text.setMaximumHeight(100)
-        self.status_text.setText("Toggle visibility of suspension components in SolidWorks")
+        self.status_text.setPlainText("Toggle visibility of suspension components in SolidWorks")
         
         # Main suspension groups
         group_main = QGroupBox("Suspension Groups")
         grid_main = QGridLayout()
         
         self.btn_show_all = QPushButton("Show All")
-        self.btn_show_all.clicked.connect(lambda: self.set_visibility(set_all_suspension_visibility, True, "all"))
+        self.btn_show_all.clicked.connect(functools.partial(self.set_visibility, set_all_suspension_visibility, True, "all"))
         grid_main.addWidget(self.btn_show_all, 0, 0)
         
         self.btn_hide_all = QPushButton("Hide All")
-        self.btn_hide_all.clicked.connect(lambda: self.set_visibility(set_all_suspension_visibility, False, "all"))
+        self.btn_hide_all.clicked.connect(functools.partial(self.set_visibility, set_all_suspension_visibility, False, "all"))
         grid_main.addWidget(self.btn_hide_all, 0, 1)
         
         self.btn_show_front = QPushButton("Show Front")
-        self.btn_show_front.clicked.connect(lambda: self.set_visibility(set_front_suspension_visibility, True, "front"))
+        self.btn_show_front.clicked.connect(functools.partial(self.set_visibility, set_front_suspension_visibility, True, "front"))
         grid_main.addWidget(self.btn_show_front, 1, 0)
         
         self.btn_hide_front = QPushButton("Hide Front")
-        self.btn_hide_front.clicked.connect(lambda: self.set_visibility(set_front_suspension_visibility, False, "front"))
+        self.btn_hide_front.clicked.connect(functools.partial(self.set_visibility, set_front_suspension_visibility, False, "front"))
         grid_main.addWidget(self.btn_hide_front, 1, 1)
         
         self.btn_show_rear = QPushButton("Show Rear")
-        self.btn_show_rear.clicked.connect(lambda: self.set_visibility(set_rear_suspension_visibility, True, "rear"))
+        self.btn_show_rear.clicked.connect(functools.partial(self.set_visibility, set_rear_suspension_visibility, True, "rear"))
         grid_main.addWidget(self.btn_show_rear, 2, 0)
         
         self.btn_hide_rear = QPushButton("Hide Rear")
-        self.btn_hide_rear.clicked.connect(lambda: self.set_visibility(set_rear_suspension_visibility, False, "rear"))
+        self.btn_hide_rear.clicked.connect(functools.partial(self.set_visibility, set_rear_suspension_visibility, False, "rear"))
         grid_main.addWidget(self.btn_hide_rear, 2, 1)
         
         group_main.setLayout(grid_main)
@@ -746,27 +790,27 @@ class ViewTab(QWidget):
         grid_wheels = QGridLayout()
         
         self.btn_show_wheels = QPushButton("Show All Wheels")
-        self.btn_show_wheels.clicked.connect(lambda: self.set_visibility(set_all_wheels_visibility, True, "wheels"))
+        self.btn_show_wheels.clicked.connect(functools.partial(self.set_visibility, set_all_wheels_visibility, True, "wheels"))
         grid_wheels.addWidget(self.btn_show_wheels, 0, 0)
         
         self.btn_hide_wheels = QPushButton("Hide All Wheels")
-        self.btn_hide_wheels.clicked.connect(lambda: self.set_visibility(set_all_wheels_visibility, False, "wheels"))
+        self.btn_hide_wheels.clicked.connect(functools.partial(self.set_visibility, set_all_wheels_visibility, False, "wheels"))
         grid_wheels.addWidget(self.btn_hide_wheels, 0, 1)
         
         self.btn_show_front_wheels = QPushButton("Show Front Wheels")
-        self.btn_show_front_wheels.clicked.connect(lambda: self.set_visibility(set_front_wheels_visibility, True, "front wheels"))
+        self.btn_show_front_wheels.clicked.connect(functools.partial(self.set_visibility, set_front_wheels_visibility, True, "front wheels"))
         grid_wheels.addWidget(self.btn_show_front_wheels, 1, 0)
         
         self.btn_hide_front_wheels = QPushButton("Hide Front Wheels")
-        self.btn_hide_front_wheels.clicked.connect(lambda: self.set_visibility(set_front_wheels_visibility, False, "front wheels"))
+        self.btn_hide_front_wheels.clicked.connect(functools.partial(self.set_visibility, set_front_wheels_visibility, False, "front wheels"))
         grid_wheels.addWidget(self.btn_hide_front_wheels, 1, 1)
         
         self.btn_show_rear_wheels = QPushButton("Show Rear Wheels")
-        self.btn_show_rear_wheels.clicked.connect(lambda: self.set_visibility(set_rear_wheels_visibility, True, "rear wheels"))
+        self.btn_show_rear_wheels.clicked.connect(functools.partial(self.set_visibility, set_rear_wheels_visibility, True, "rear wheels"))
         grid_wheels.addWidget(self.btn_show_rear_wheels, 2, 0)
         
         self.btn_hide_rear_wheels = QPushButton("Hide Rear Wheels")
-        self.btn_hide_rear_wheels.clicked.connect(lambda: self.set_visibility(set_rear_wheels_visibility, False, "rear wheels"))
+        self.btn_hide_rear_wheels.clicked.connect(functools.partial(self.set_visibility, set_rear_wheels_visibility, False, "rear wheels"))
         grid_wheels.addWidget(self.btn_hide_rear_wheels, 2, 1)
         
         group_wheels.setLayout(grid_wheels)
@@ -777,19 +821,19 @@ class ViewTab(QWidget):
         grid_chassis = QGridLayout()
         
         self.btn_show_chassis = QPushButton("Show Chassis Points")
-        self.btn_show_chassis.clicked.connect(lambda: self.set_visibility(set_chassis_points_visibility, True, "chassis points"))
+        self.btn_show_chassis.clicked.connect(functools.partial(self.set_visibility, set_chassis_points_visibility, True, "chassis points"))
         grid_chassis.addWidget(self.btn_show_chassis, 0, 0)
         
         self.btn_hide_chassis = QPushButton("Hide Chassis Points")
-        self.btn_hide_chassis.clicked.connect(lambda: self.set_visibility(set_chassis_points_visibility, False, "chassis points"))
+        self.btn_hide_chassis.clicked.connect(functools.partial(self.set_visibility, set_chassis_points_visibility, False, "chassis points"))
         grid_chassis.addWidget(self.btn_hide_chassis, 0, 1)
         
         self.btn_show_nonchassis = QPushButton("Show Non-Chassis")
-        self.btn_show_nonchassis.clicked.connect(lambda: self.set_visibility(set_non_chassis_visibility, True, "non-chassis points"))
+        self.btn_show_nonchassis.clicked.connect(functools.partial(self.set_visibility, set_non_chassis_visibility, True, "non-chassis points"))
         grid_chassis.addWidget(self.btn_show_nonchassis, 1, 0)
         
         self.btn_hide_nonchassis = QPushButton("Hide Non-Chassis")
-        self.btn_hide_nonchassis.clicked.connect(lambda: self.set_visibility(set_non_chassis_visibility, False, "non-chassis points"))
+        self.btn_hide_nonchassis.clicked.connect(functools.partial(self.set_visibility, set_non_chassis_visibility, False, "non-chassis points"))
         grid_chassis.addWidget(self.btn_hide_nonchassis, 1, 1)
         
         group_chassis.setLayout(grid_chassis)
@@ -803,13 +847,17 @@ class ViewTab(QWidget):
         self.custom_filter.setPlaceholderText("Enter text to match (e.g., 'Upright', 'Pushrod')")
         h_custom.addWidget(self.custom_filter)
         
-        btn_show_custom = QPushButton("Show")
-        btn_show_custom.clicked.connect(self.show_custom)
-        h_custom.addWidget(btn_show_custom)
+        # Enabled only while there is filter text
+        self.btn_show_custom = QPushButton("Show")
+        self.btn_show_custom.setEnabled(False)
+        self.btn_show_custom.clicked.connect(self.show_custom)
+        h_custom.addWidget(self.btn_show_custom)
         
-        btn_hide_custom = QPushButton("Hide")
-        btn_hide_custom.clicked.connect(self.hide_custom)
-        h_custom.addWidget(btn_hide_custom)
+        self.btn_hide_custom = QPushButton("Hide")
+        self.btn_hide_custom.setEnabled(False)
+        self.btn_hide_custom.clicked.connect(self.hide_custom)
+        h_custom.addWidget(self.btn_hide_custom)
+        self.custom_filter.textChanged.connect(self._on_custom_filter_changed)
         
         group_custom.setLayout(h_custom)
         layout.addWidget(group_custom)
@@ -819,71 +867,105 @@ class ViewTab(QWidget):
         layout.addWidget(self.status_text)
         
         btn_clear = QPushButton("Clear Log")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
         
         layout.addStretch()
         self.setLayout(layout)
     
-    def set_visibility(self, func, visible, description):
-        """Execute a visibility function and update status."""
+    def set_visibility(self, func, visible, description, _checked=False):
+        """Queue a visibility change; queued changes are run after a short delay."""
+        if self._pending and self._pending[-1][0] is func and self._pending[-1][2] == description:
+            # Show/hide of the same target clicked again: only the last state matters
+            self._pending[-1] = (func, visible, description)
+        else:
+            self._pending.append((func, visible, description))
+        self._debounce.start()
+
+    def _dispatch_visibility(self):
+        """Run the oldest queued visibility change on a worker thread."""
+        if not self._pending:
+            return
+        if self.vis_worker is not None and self.vis_worker.isRunning():
+            # One SuspensionTools.exe at a time; retry once the current command finishes
+            self._debounce.start()
+            return
+        func, visible, description = self._pending.pop(0)
+        if self._pending:
+            self._debounce.start()
+
         action = "Showing" if visible else "Hiding"
-        self.status_text.append(f"{action} {description}...")
-        try:
-            success = func(visible)
-            if success:
-                self.status_text.append(f"✓ {description} {'shown' if visible else 'hidden'}")
-            else:
-                self.status_text.append(f"✗ Failed to modify {description}")
-        except FileNotFoundError as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+        self.status_text.appendPlainText(f"{action} {description}...")
+        self.vis_worker = VisibilityWorker(func, visible)
+        self.vis_worker.finished.connect(
+            lambda success, d=description, v=visible: self._on_visibility_finished(success, d, v))
+        self.vis_worker.failed.connect(self._on_visibility_failed)
+        self.vis_worker.start()
+
+    def _on_visibility_finished(self, success, description, visible):
+        if success:
+            self.status_text.appendPlainText(f"✓ {description} {'shown' if visible else 'hidden'}")
+        else:
+            self.status_text.appendPlainText(f"✗ Failed to modify {description}")
+
+    def _on_visibility_failed(self, error):
+        self.status_text.appendPlainText(f"✗ Error: {str(error)}")
+        if isinstance(error, FileNotFoundError):
             QMessageBox.critical(self, "Error", 
                                  f"SuspensionTools.exe not found.\n\n"
                                  "Run 'dotnet build -c Release' in the sw_drawer folder first.")
-        except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed: {str(e)}")
+        else:
+            QMessageBox.critical(self, "Error", f"Failed: {str(error)}")
 
     def test_solidworks_connection(self):
         """Test SolidWorks connection and print active assembly/configuration."""
         try:
+            from test_solidworks_connection import get_active_assembly_and_configuration
             assembly_name, config_name = get_active_assembly_and_configuration()
-            self.status_text.append("✓ SolidWorks connection successful")
-            self.status_text.append(f"✓ Active assembly: {assembly_name}")
-            self.status_text.append(f"✓ Active configuration: {config_name}")
+            self.status_text.appendPlainText("✓ SolidWorks connection successful")
+            self.status_text.appendPlainText(f"✓ Active assembly: {assembly_name}")
+            self.status_text.appendPlainText(f"✓ Active configuration: {config_name}")
         except Exception as e:
-            self.status_text.append(f"✗ Connection failed: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Connection failed: {str(e)}")
+    
+    def _on_custom_filter_changed(self, text):
+        has_text = bool(text.strip())
+        self.btn_show_custom.setEnabled(has_text)
+        self.btn_hide_custom.setEnabled(has_text)
     
     def show_custom(self):
         """Show features matching custom filter."""
         text = self.custom_filter.text().strip()
-        if not text:
-            QMessageBox.warning(self, "Warning", "Please enter a filter text")
-            return
-        self.status_text.append(f"Showing features containing '{text}'...")
+        self.status_text.appendPlainText(f"Showing features containing '{text}'...")
         try:
             set_visibility_by_substring(text, True)
-            self.status_text.append(f"✓ Done")
+            self.status_text.appendPlainText(f"✓ Done")
         except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error: {str(e)}")
     
     def hide_custom(self):
         """Hide features matching custom filter."""
         text = self.custom_filter.text().strip()
-        if not text:
-            QMessageBox.warning(self, "Warning", "Please enter a filter text")
-            return
-        self.status_text.append(f"Hiding features containing '{text}'...")
+        self.status_text.appendPlainText(f"Hiding features containing '{text}'...")
         try:
             set_visibility_by_substring(text, False)
-            self.status_text.append(f"✓ Done")
+            self.status_text.appendPlainText(f"✓ Done")
         except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error: {str(e)}")
 
 
 class MarkersTab(QWidget):
     """Tab for creating and controlling visibility of marker spheres."""
-    
+
+    # JSON name prefix, button background, button text colour
+    COMPONENT_TYPES = [
+        ("CHAS_", "#FF0000", "white"),   # Chassis
+        ("UPRI_", "#0000FF", "white"),   # Upright
+        ("ROCK_", "#0080FF", "white"),   # Rocker
+        ("NSMA_", "#FFC0CB", "black"),   # Non-Sprung Mass
+        ("TiePnt", "#FFA500", "black"),  # Tie Rod
+    ]
+
     def __init__(self):
         super().__init__()
         self.worker = None
@@ -891,26 +973,32 @@ class MarkersTab(QWidget):
     
     def init_ui(self):
         layout = QVBoxLayout()
+        type_rules = "".join(
+            f"QPushButton#Show_{prefix} {{ background-color: {background}; color: {foreground}; }}\n"
+            for prefix, background, foreground in self.COMPONENT_TYPES)
+        self.setStyleSheet(OPERATION_TAB_STYLESHEET
+                           + "QPushButton#DeleteButton { background-color: #ffcccc; }\n"
+                           + type_rules)
         
         # Title
         layout.addWidget(QLabel("Marker Spheres - Visual indicators at hardpoints"))
         
         # State label
         self.state_label = QLabel("")
-        self.state_label.setStyleSheet("font-weight: bold; color: #0066cc;")
+        self.state_label.setObjectName("StateLabel")
         self.state_label.setVisible(False)
         layout.addWidget(self.state_label)
         
         # Progress bar and abort button (hidden by default)
         h_progress = QHBoxLayout()
-        self.progress_bar = QProgressBar()
+        self.progress_bar = ThrottledProgressBar()
         self.progress_bar.setVisible(False)
         self.progress_bar.setFormat("%v / %m (%p%)")
         h_progress.addWidget(self.progress_bar)
         
         self.btn_abort = QPushButton("Abort")
         self.btn_abort.setVisible(False)
-        self.btn_abort.setStyleSheet("background-color: #ff6666;")
+        self.btn_abort.setObjectName("AbortButton")
         self.btn_abort.clicked.connect(self.abort_operation)
         h_progress.addWidget(self.btn_abort)
         
@@ -933,7 +1021,7 @@ class MarkersTab(QWidget):
         
         self.btn_delete_all = QPushButton("Delete All Markers")
         self.btn_delete_all.clicked.connect(self.delete_all_markers)
-        self.btn_delete_all.setStyleSheet("background-color: #ffcccc;")
+        self.btn_delete_all.setObjectName("DeleteButton")
         h_create.addWidget(self.btn_delete_all)
         
         group_create.setLayout(h_create)
@@ -944,27 +1032,27 @@ class MarkersTab(QWidget):
         grid_main = QGridLayout()
         
         btn_show_all = QPushButton("Show All")
-        btn_show_all.clicked.connect(lambda: self.set_visibility(set_all_markers_visibility, True, "all markers"))
+        btn_show_all.clicked.connect(functools.partial(self.set_visibility, set_all_markers_visibility, True, "all markers"))
         grid_main.addWidget(btn_show_all, 0, 0)
         
         btn_hide_all = QPushButton("Hide All")
-        btn_hide_all.clicked.connect(lambda: self.set_visibility(set_all_markers_visibility, False, "all markers"))
+        btn_hide_all.clicked.connect(functools.partial(self.set_visibility, set_all_markers_visibility, False, "all markers"))
         grid_main.addWidget(btn_hide_all, 0, 1)
         
         btn_show_front = QPushButton("Show FRONT")
-        btn_show_front.clicked.connect(lambda: self.set_visibility(set_front_markers_visibility, True, "front markers"))
+        btn_show_front.clicked.connect(functools.partial(self.set_visibility, set_front_markers_visibility, True, "front markers"))
         grid_main.addWidget(btn_show_front, 1, 0)
         
         btn_hide_front = QPushButton("Hide FRONT")
-        btn_hide_front.clicked.connect(lambda: self.set_visibility(set_front_markers_visibility, False, "front markers"))
+        btn_hide_front.clicked.connect(functools.partial(self.set_visibility, set_front_markers_visibility, False, "front markers"))
         grid_main.addWidget(btn_hide_front, 1, 1)
         
         btn_show_rear = QPushButton("Show REAR")
-        btn_show_rear.clicked.connect(lambda: self.set_visibility(set_rear_markers_visibility, True, "rear markers"))
+        btn_show_rear.clicked.connect(functools.partial(self.set_visibility, set_rear_markers_visibility, True, "rear markers"))
         grid_main.addWidget(btn_show_rear, 2, 0)
         
         btn_hide_rear = QPushButton("Hide REAR")
-        btn_hide_rear.clicked.connect(lambda: self.set_visibility(set_rear_markers_visibility, False, "rear markers"))
+        btn_hide_rear.clicked.connect(functools.partial(self.set_visibility, set_rear_markers_visibility, False, "rear markers"))
         grid_main.addWidget(btn_hide_rear, 2, 1)
         
         group_main.setLayout(grid_main)
@@ -974,53 +1062,17 @@ class MarkersTab(QWidget):
         group_types = QGroupBox("By Component Type (JSON prefixes)")
         grid_types = QGridLayout()
         
-        # Row 0: CHAS_ (Chassis) and UPRI_ (Upright)
-        btn_show_chas = QPushButton("Show CHAS_")
-        btn_show_chas.setStyleSheet("background-color: #FF0000; color: white;")
-        btn_show_chas.clicked.connect(lambda: self.set_name_visibility("CHAS_", True))
-        grid_types.addWidget(btn_show_chas, 0, 0)
-        
-        btn_hide_chas = QPushButton("Hide")
-        btn_hide_chas.clicked.connect(lambda: self.set_name_visibility("CHAS_", False))
-        grid_types.addWidget(btn_hide_chas, 0, 1)
-        
-        btn_show_upri = QPushButton("Show UPRI_")
-        btn_show_upri.setStyleSheet("background-color: #0000FF; color: white;")
-        btn_show_upri.clicked.connect(lambda: self.set_name_visibility("UPRI_", True))
-        grid_types.addWidget(btn_show_upri, 0, 2)
-        
-        btn_hide_upri = QPushButton("Hide")
-        btn_hide_upri.clicked.connect(lambda: self.set_name_visibility("UPRI_", False))
-        grid_types.addWidget(btn_hide_upri, 0, 3)
-        
-        # Row 1: ROCK_ (Rocker) and NSMA_ (Non-Sprung Mass)
-        btn_show_rock = QPushButton("Show ROCK_")
-        btn_show_rock.setStyleSheet("background-color: #0080FF; color: white;")
-        btn_show_rock.clicked.connect(lambda: self.set_name_visibility("ROCK_", True))
-        grid_types.addWidget(btn_show_rock, 1, 0)
-        
-        btn_hide_rock = QPushButton("Hide")
-        btn_hide_rock.clicked.connect(lambda: self.set_name_visibility("ROCK_", False))
-        grid_types.addWidget(btn_hide_rock, 1, 1)
-        
-        btn_show_nsma = QPushButton("Show NSMA_")
-        btn_show_nsma.setStyleSheet("background-color: #FFC0CB; color: black;")
-        btn_show_nsma.clicked.connect(lambda: self.set_name_visibility("NSMA_", True))
-        grid_types.addWidget(btn_show_nsma, 1, 2)
-        
-        btn_hide_nsma = QPushButton("Hide")
-        btn_hide_nsma.clicked.connect(lambda: self.set_name_visibility("NSMA_", False))
-        grid_types.addWidget(btn_hide_nsma, 1, 3)
-
-        # Row 2: TiePnt (Tie Rod)
-        btn_show_tier = QPushButton("Show TiePnt")
-        btn_show_tier.setStyleSheet("background-color: #FFA500; color: black;")
-        btn_show_tier.clicked.connect(lambda: self.set_name_visibility("TiePnt", True))
-        grid_types.addWidget(btn_show_tier, 2, 0)
-
-        btn_hide_tier = QPushButton("Hide")
-        btn_hide_tier.clicked.connect(lambda: self.set_name_visibility("TiePnt", False))
-        grid_types.addWidget(btn_hide_tier, 2, 1)
+        # Two prefixes per row: [Show PREFIX][Hide][Show PREFIX][Hide]
+        for i, (prefix, background, foreground) in enumerate(self.COMPONENT_TYPES):
+            row, col = divmod(i, 2)
+            btn_show = QPushButton(f"Show {prefix}")
+            btn_show.setObjectName(f"Show_{prefix}")
+            btn_show.clicked.connect(functools.partial(self.set_name_visibility, prefix, True))
+            grid_types.addWidget(btn_show, row, col * 2)
+
+            btn_hide = QPushButton("Hide")
+            btn_hide.clicked.connect(functools.partial(self.set_name_visibility, prefix, False))
+            grid_types.addWidget(btn_hide, row, col * 2 + 1)
         
         group_types.setLayout(grid_types)
         layout.addWidget(group_types)
@@ -1033,28 +1085,34 @@ class MarkersTab(QWidget):
         self.custom_filter.setPlaceholderText("Filter by name (e.g., 'Low', 'Upp', 'Piv')")
         h_custom.addWidget(self.custom_filter)
         
-        btn_show_custom = QPushButton("Show")
-        btn_show_custom.clicked.connect(self.show_custom)
-        h_custom.addWidget(btn_show_custom)
+        # Enabled only while there is filter text
+        self.btn_show_custom = QPushButton("Show")
+        self.btn_show_custom.setEnabled(False)
+        self.btn_show_custom.clicked.connect(self.show_custom)
+        h_custom.addWidget(self.btn_show_custom)
         
-        btn_hide_custom = QPushButton("Hide")
-        btn_hide_custom.clicked.connect(self.hide_custom)
-        h_custom.addWidget(btn_hide_custom)
+        self.btn_hide_custom = QPushButton("Hide")
+        self.btn_hide_custom.setEnabled(False)
+        self.btn_hide_custom.clicked.connect(self.hide_custom)
+        h_custom.addWidget(self.btn_hide_custom)
+        self.custom_filter.textChanged.connect(self._on_custom_filter_changed)
         
         group_custom.setLayout(h_custom)
         layout.addWidget(group_custom)
         
         # Console output
         layout.addWidget(QLabel("Output:"))
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
         self.status_text.setMaximumHeight(120)
-        self.status_text.setText("Ready")
+        self.status_text.setPlainText("Ready")
         layout.addWidget(self.status_text)
         
         btn_clear = QPushButton("Clear Log")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
         
         layout.addStretch()
@@ -1066,20 +1124,8 @@ class MarkersTab(QWidget):
         self.btn_delete_all.setEnabled(enabled)
     
     def on_progress(self, current, total):
-        """Update progress bar with current/total values like progressBar.setValue(i)."""
-        if total > 0:
-            # Set up determinate mode if not already set
-            if self.progress_bar.maximum() != total:
-                self.progress_bar.setRange(0, total)  # Like progressBar.setRange(0, steps)
-                self.progress_bar.setFormat("%v / %m (%p%)")  # Show "current / max (percentage%)"
-            
-            # Set current progress directly like progressBar.setValue(i)
-            self.progress_bar.setValue(current)
-        else:
-            # Keep indeterminate mode if total is 0 or unknown
-            if self.progress_bar.maximum() != 0:
-                self.progress_bar.setRange(0, 0)  # Indeterminate mode
-                self.progress_bar.setFormat("Working...")
+        """Update progress bar with current/total values."""
+        self.progress_bar.set_progress(current, total)
     
     def on_state_changed(self, state_description):
         """Update state label with current operation state."""
@@ -1097,7 +1143,7 @@ class MarkersTab(QWidget):
         self.state_label.setText("Starting...")
         self.state_label.setVisible(True)
         self.set_buttons_enabled(False)
-        self.status_text.append(f"\n{message}")
+        self.status_text.appendPlainText(f"\n{message}")
     
     def stop_loading(self, success, message):
         """Hide progress bar and abort button."""
@@ -1105,20 +1151,23 @@ class MarkersTab(QWidget):
         self.btn_abort.setVisible(False)
         self.state_label.setVisible(False)
         self.set_buttons_enabled(True)
-        self.worker = None
+        # run() may still be returning when finished arrives; only drop the worker once its thread
+        # has exited, otherwise keep it until the next operation replaces it
+        if self.worker is not None and self.worker.wait(WORKER_EXIT_WAIT_MS):
+            self.worker = None
         if success:
-            self.status_text.append(f"✓ {message}")
+            self.status_text.appendPlainText(f"✓ {message}")
         else:
-            self.status_text.append(f"✗ {message}")
+            self.status_text.appendPlainText(f"✗ {message}")
     
     def append_log(self, text):
         """Append text to log."""
-        self.status_text.append(text)
+        self.status_text.appendPlainText(text)
     
     def abort_operation(self):
         """Abort the current operation."""
         if self.worker:
-            self.status_text.append("Aborting operation...")
+            self.status_text.appendPlainText("Aborting operation...")
             self.worker.abort()
     
     def create_all_markers(self):
@@ -1147,53 +1196,55 @@ class MarkersTab(QWidget):
             self.worker.finished.connect(self.stop_loading)
             self.worker.start()
 
-    def set_visibility(self, func, visible, description):
+    def set_visibility(self, func, visible, description, _checked=False):
         """Execute a visibility function and update status."""
         action = "Showing" if visible else "Hiding"
-        self.status_text.append(f"{action} {description}...")
+        self.status_text.appendPlainText(f"{action} {description}...")
         try:
             success = func(visible)
-            self.status_text.append("✓ Done" if success else "✗ Failed")
+            self.status_text.appendPlainText("✓ Done" if success else "✗ Failed")
         except FileNotFoundError:
-            self.status_text.append("✗ InsertMarker.exe not found. Build the project first.")
+            self.status_text.appendPlainText("✗ InsertMarker.exe not found. Build the project first.")
             QMessageBox.critical(self, "Error", 
                                  "InsertMarker.exe not found.\n\n"
                                  "Run 'dotnet build -c Release' in the InsertMarker folder first.")
         except Exception as e:
-            self.status_text.append(f"✗ {str(e)}")
+            self.status_text.appendPlainText(f"✗ {str(e)}")
     
-    def set_name_visibility(self, substring, visible):
+    def set_name_visibility(self, substring, visible, _checked=False):
         """Show/hide markers by name substring."""
         action = "Showing" if visible else "Hiding"
-        self.status_text.append(f"{action} {substring} markers...")
+        self.status_text.appendPlainText(f"{action} {substring} markers...")
         try:
             success = set_marker_visibility_by_name(substring, visible)
-            self.status_text.append("✓ Done" if success else "✗ Failed")
+            self.status_text.appendPlainText("✓ Done" if success else "✗ Failed")
         except FileNotFoundError:
-            self.status_text.append("✗ InsertMarker.exe not found. Build the project first.")
+            self.status_text.appendPlainText("✗ InsertMarker.exe not found. Build the project first.")
         except Exception as e:
-            self.status_text.append(f"✗ {str(e)}")
+            self.status_text.appendPlainText(f"✗ {str(e)}")
+    
+    def _on_custom_filter_changed(self, text):
+        has_text = bool(text.strip())
+        self.btn_show_custom.setEnabled(has_text)
+        self.btn_hide_custom.setEnabled(has_text)
     
     def show_custom(self):
         """Show markers matching custom filter."""
         text = self.custom_filter.text().strip()
-        if not text:
-            QMessageBox.warning(self, "Warning", "Enter filter text")
-            return
         self.set_name_visibility(text, True)
     
     def hide_custom(self):
         """Hide markers matching custom filter."""
         text = self.custom_filter.text().strip()
-        if not text:
-            QMessageBox.warning(self, "Warning", "Enter filter text")
-            return
         self.set_name_visibility(text, False)
 
 
 class CoordinateInsertionTab(QWidget):
     """Tab for inserting coordinate systems with color coding and naming."""
-    
+
+    # Shipped with the app; resolved once at import
+    MARKER_PATH = get_resource_path("Marker.SLDPRT")
+
     def __init__(self):
         super().__init__()
         self.worker = None
@@ -1201,6 +1252,10 @@ class CoordinateInsertionTab(QWidget):
     
     def init_ui(self):
         layout = QVBoxLayout()
+        self.setStyleSheet(OPERATION_TAB_STYLESHEET + """
+QPushButton#PrimaryButton { font-size: 12pt; font-weight: bold; }
+QLabel#NoteLabel { color: #666666; font-style: italic; }
+""" + color_coding_stylesheet("QLabel#Color_", "padding: 2px; "))
         
         # Title
         layout.addWidget(QLabel("Insert Coordinates"))
@@ -1212,20 +1267,20 @@ class CoordinateInsertionTab(QWidget):
         
         # State label
         self.state_label = QLabel("")
-        self.state_label.setStyleSheet("font-weight: bold; color: #0066cc;")
+        self.state_label.setObjectName("StateLabel")
         self.state_label.setVisible(False)
         layout.addWidget(self.state_label)
         
         # Progress bar and abort button (hidden by default)
         h_progress = QHBoxLayout()
-        self.progress_bar = QProgressBar()
+        self.progress_bar = ThrottledProgressBar()
         self.progress_bar.setVisible(False)
         self.progress_bar.setFormat("%v / %m (%p%)")
         h_progress.addWidget(self.progress_bar)
         
         self.btn_abort = QPushButton("Abort")
         self.btn_abort.setVisible(False)
-        self.btn_abort.setStyleSheet("background-color: #ff6666;")
+        self.btn_abort.setObjectName("AbortButton")
         self.btn_abort.clicked.connect(self.abort_operation)
         h_progress.addWidget(self.btn_abort)
         
@@ -1254,14 +1309,14 @@ class CoordinateInsertionTab(QWidget):
         # Operations
         self.btn_insert = QPushButton("Insert Hardpoints")
         self.btn_insert.setMinimumHeight(40)
-        self.btn_insert.setStyleSheet("font-size: 12pt; font-weight: bold;")
+        self.btn_insert.setObjectName("PrimaryButton")
         self.btn_insert.clicked.connect(self.insert_hardpoints)
         layout.addWidget(self.btn_insert)
         
         # Add a separator and note about folder organization
         layout.addWidget(QLabel(""))
         note_label = QLabel("Note: All hardpoints are automatically organized into folders in the SolidWorks feature tree")
-        note_label.setStyleSheet("color: #666666; font-style: italic;")
+        note_label.setObjectName("NoteLabel")
         layout.addWidget(note_label)
         
         # Color coding information
@@ -1271,7 +1326,7 @@ class CoordinateInsertionTab(QWidget):
         color_info = get_color_coding_info()
         for prefix, info in color_info.items():
             color_label = QLabel(f"{info['name']}: RGB({info['rgb'][0]}, {info['rgb'][1]}, {info['rgb'][2]})")
-            color_label.setStyleSheet(f"background-color: rgb({info['rgb'][0]}, {info['rgb'][1]}, {info['rgb'][2]}); color: white; padding: 2px;")
+            color_label.setObjectName(f"Color_{prefix}")
             layout_colors.addWidget(color_label)
         
         group_colors.setLayout(layout_colors)
@@ -1279,15 +1334,17 @@ class CoordinateInsertionTab(QWidget):
         
         # Console output
         layout.addWidget(QLabel("Output:"))
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
         self.status_text.setMaximumHeight(150)
-        self.status_text.setText("Ready")
+        self.status_text.setPlainText("Ready")
         layout.addWidget(self.status_text)
         
         btn_clear = QPushButton("Clear Log")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
         
         layout.addStretch()
@@ -1299,15 +1356,7 @@ class CoordinateInsertionTab(QWidget):
     
     def on_progress(self, current, total):
         """Update progress bar with current/total values."""
-        if total > 0:
-            if self.progress_bar.maximum() != total:
-                self.progress_bar.setRange(0, total)
-                self.progress_bar.setFormat("%v / %m (%p%)")
-            self.progress_bar.setValue(current)
-        else:
-            if self.progress_bar.maximum() != 0:
-                self.progress_bar.setRange(0, 0)
-                self.progress_bar.setFormat("Working...")
+        self.progress_bar.set_progress(current, total)
     
     def on_state_changed(self, state_description):
         """Update state label with current operation state."""
@@ -1324,7 +1373,7 @@ class CoordinateInsertionTab(QWidget):
         self.state_label.setText("Starting...")
         self.state_label.setVisible(True)
         self.set_buttons_enabled(False)
-        self.status_text.append(f"\n{message}")
+        self.status_text.appendPlainText(f"\n{message}")
     
     def stop_loading(self, success, message):
         """Hide progress bar and abort button."""
@@ -1332,41 +1381,47 @@ class CoordinateInsertionTab(QWidget):
         self.btn_abort.setVisible(False)
         self.state_label.setVisible(False)
         self.set_buttons_enabled(True)
-        self.worker = None
+        # run() may still be returning when finished arrives; only drop the worker once its thread
+        # has exited, otherwise keep it until the next operation replaces it
+        if self.worker is not None and self.worker.wait(WORKER_EXIT_WAIT_MS):
+            self.worker = None
         if success:
-            self.status_text.append(f"✓ {message}")
+            self.status_text.appendPlainText(f"✓ {message}")
         else:
-            self.status_text.append(f"✗ {message}")
+            self.status_text.appendPlainText(f"✗ {message}")
     
     def append_log(self, text):
         """Append text to log."""
-        self.status_text.append(text)
+        self.status_text.appendPlainText(text)
 
     def test_solidworks_connection(self):
         """Test SolidWorks connection and print active assembly/configuration."""
         try:
+            from test_solidworks_connection import get_active_assembly_and_configuration
             assembly_name, config_name = get_active_assembly_and_configuration()
-            self.status_text.append("✓ SolidWorks connection successful")
-            self.status_text.append(f"✓ Active assembly: {assembly_name}")
-            self.status_text.append(f"✓ Active configuration: {config_name}")
+            self.status_text.appendPlainText("✓ SolidWorks connection successful")
+            self.status_text.appendPlainText(f"✓ Active assembly: {assembly_name}")
+            self.status_text.appendPlainText(f"✓ Active configuration: {config_name}")
         except Exception as e:
-            self.status_text.append(f"✗ Connection failed: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Connection failed: {str(e)}")
     
     def abort_operation(self):
         """Abort the current operation."""
         if self.worker:
-            self.status_text.append("Aborting operation...")
+            self.status_text.appendPlainText("Aborting operation...")
             self.worker.abort()
     
     def browse_json_file(self):
         """Browse for JSON file."""
-        file_path = QFileDialog.getOpenFileName(self, "Select JSON File", filter="*.json")[0]
+        file_path = QFileDialog.getOpenFileName(self, "Select JSON File", filter="*.json",
+                                                options=FILE_DIALOG_OPTIONS)[0]
         if file_path:
             self.json_path.setText(file_path)
     
     def browse_marker_file(self):
         """Browse for Marker.sldprt file."""
-        file_path = QFileDialog.getOpenFileName(self, "Select Marker Part", filter="*.sldprt")[0]
+        file_path = QFileDialog.getOpenFileName(self, "Select Marker Part", filter="*.sldprt",
+                                                options=FILE_DIALOG_OPTIONS)[0]
         if file_path:
             self.marker_path.setText(file_path)
     
@@ -1378,12 +1433,12 @@ class CoordinateInsertionTab(QWidget):
             return
 
         inboard_json = os.path.join(project_path, "Inboard.json")
-        if not os.path.exists(inboard_json):
+        if not os.path.isfile(inboard_json):
             QMessageBox.warning(self, "Missing File",
                                 "Inboard.json not found in project folder. Parse an Excel file first.")
             return
 
-        marker_path = get_resource_path("Marker.SLDPRT")
+        marker_path = self.MARKER_PATH
         if not os.path.exists(marker_path):
             QMessageBox.critical(self, "Missing Marker", f"Marker.SLDPRT not found at {marker_path}")
             return
@@ -1392,7 +1447,7 @@ class CoordinateInsertionTab(QWidget):
 
         try:
             exe_path = find_suspension_tools_exe()
-            self.status_text.append(f"Using executable: {exe_path}")
+            self.status_text.appendPlainText(f"Using executable: {exe_path}")
             cmd = [exe_path, "hardpoints", "add", project_path, marker_path]
 
             self.worker = HardpointWorker(self.run_hardpoint_command, cmd)
@@ -1403,27 +1458,25 @@ class CoordinateInsertionTab(QWidget):
             self.worker.start()
 
         except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to run hardpoint runner: {str(e)}")
 
     def run_hardpoint_command(self, cmd, worker=None):
         """Run a hardpoint command using subprocess."""
         try:
-            # Run the command
+            # Run the command; binary pipe so output is read and decoded in chunks
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                stderr=subprocess.STDOUT
             )
             
             # Store process reference for abort functionality
             if worker:
                 worker._process = process
             
-            # Read output line by line
-            for line in iter(process.stdout.readline, ''):
+            # Read whatever output is available, in blocks of whole lines
+            for block in iter_output_blocks(process.stdout):
                 if worker and worker._abort:
                     try:
                         if process.poll() is None:
@@ -1434,39 +1487,11 @@ class CoordinateInsertionTab(QWidget):
                             process.kill()
                         except:
                             pass
-
-                    released, release_message = release_solidworks_command_state()
-                    if not released and worker:
-                        worker.log.emit(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
                     return False
 
-                line = line.strip()
-                if line:
-                    # Parse special output lines for progress and state
-                    if line.startswith("TOTAL:"):
-                        try:
-                            new_total = int(line.split(":")[1])
-                            if worker:
-                                worker._total_tasks = new_total
-                                worker.progress.emit(worker._current_progress, worker._total_tasks)
-                        except:
-                            pass
-                    elif line.startswith("PROGRESS:"):
-                        try:
-                            current = int(line.split(":")[1])
-                            if worker:
-                                worker._current_progress = current
-                                worker.progress.emit(worker._current_progress, worker._total_tasks)
-                        except:
-                            pass
-                    elif line.startswith("STATE:"):
-                        state = line.split(":")[1]
-                        if worker:
-                            worker.state_changed.emit(state)
-                    else:
-                        # Normal log line
-                        if worker:
-                            worker.log.emit(line)
+                # Captured by the worker, which splits the lines, parses
+                # TOTAL:/PROGRESS:/STATE: and batches progress and log updates
+                print(block)
             
             # Wait for completion
             process.wait()
@@ -1477,8 +1502,7 @@ class CoordinateInsertionTab(QWidget):
                 raise Exception(f"Command failed with exit code {process.returncode}")
                 
         except Exception as e:
-            if worker:
-                worker.log.emit(f"Error: {str(e)}")
+            print(f"Error: {str(e)}")
             raise e
 
     def insert_wheel_coordinates(self):
@@ -1488,7 +1512,7 @@ class CoordinateInsertionTab(QWidget):
             QMessageBox.warning(self, "No Project", "Set a project folder in the Project tab first.")
             return
 
-        marker_path = get_resource_path("Marker.SLDPRT")
+        marker_path = self.MARKER_PATH
         if not os.path.exists(marker_path):
             QMessageBox.critical(self, "Missing Marker", f"Marker.SLDPRT not found at {marker_path}")
             return
@@ -1497,7 +1521,7 @@ class CoordinateInsertionTab(QWidget):
 
         try:
             exe_path = find_suspension_tools_exe()
-            self.status_text.append(f"Using executable: {exe_path}")
+            self.status_text.appendPlainText(f"Using executable: {exe_path}")
             cmd = [exe_path, "hardpoints", "addwheels", project_path, marker_path]
 
             self.worker = HardpointWorker(self.run_hardpoint_command, cmd)
@@ -1508,17 +1532,17 @@ class CoordinateInsertionTab(QWidget):
             self.worker.start()
 
         except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to run hardpoint runner: {str(e)}")
     
     def create_coordinates_folder(self):
         """Create the coordinates folder."""
         try:
             folder_path = create_coordinates_folder()
-            self.status_text.append(f"✓ Created coordinates folder: {folder_path}")
+            self.status_text.appendPlainText(f"✓ Created coordinates folder: {folder_path}")
             QMessageBox.information(self, "Success", f"Created coordinates folder: {folder_path}")
         except Exception as e:
-            self.status_text.append(f"✗ Error creating folder: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error creating folder: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to create folder: {str(e)}")
 
 
@@ -1532,6 +1556,7 @@ class PoseCreationTab(QWidget):
     
     def init_ui(self):
         layout = QVBoxLayout()
+        self.setStyleSheet(OPERATION_TAB_STYLESHEET)
         
         # Title
         layout.addWidget(QLabel("Write Pose"))
@@ -1543,20 +1568,20 @@ class PoseCreationTab(QWidget):
         
         # State label
         self.state_label = QLabel("")
-        self.state_label.setStyleSheet("font-weight: bold; color: #0066cc;")
+        self.state_label.setObjectName("StateLabel")
         self.state_label.setVisible(False)
         layout.addWidget(self.state_label)
         
         # Progress bar and abort button (hidden by default)
         h_progress = QHBoxLayout()
-        self.progress_bar = QProgressBar()
+        self.progress_bar = ThrottledProgressBar()
         self.progress_bar.setVisible(False)
         self.progress_bar.setFormat("%v / %m (%p%)")
         h_progress.addWidget(self.progress_bar)
         
         self.btn_abort = QPushButton("Abort")
         self.btn_abort.setVisible(False)
-        self.btn_abort.setStyleSheet("background-color: #ff6666;")
+        self.btn_abort.setObjectName("AbortButton")
         self.btn_abort.clicked.connect(self.abort_operation)
         h_progress.addWidget(self.btn_abort)
         
@@ -1602,15 +1627,17 @@ class PoseCreationTab(QWidget):
 
         # Console output
         layout.addWidget(QLabel("Output:"))
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
         self.status_text.setMaximumHeight(150)
-        self.status_text.setText("Ready")
+        self.status_text.setPlainText("Ready")
         layout.addWidget(self.status_text)
         
         btn_clear = QPushButton("Clear Log")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
         
         layout.addStretch()
@@ -1624,15 +1651,7 @@ class PoseCreationTab(QWidget):
     
     def on_progress(self, current, total):
         """Update progress bar with current/total values."""
-        if total > 0:
-            if self.progress_bar.maximum() != total:
-                self.progress_bar.setRange(0, total)
-                self.progress_bar.setFormat("%v / %m (%p%)")
-            self.progress_bar.setValue(current)
-        else:
-            if self.progress_bar.maximum() != 0:
-                self.progress_bar.setRange(0, 0)
-                self.progress_bar.setFormat("Working...")
+        self.progress_bar.set_progress(current, total)
     
     def on_state_changed(self, state_description):
         """Update state label with current operation state."""
@@ -1649,7 +1668,7 @@ class PoseCreationTab(QWidget):
         self.state_label.setText("Starting...")
         self.state_label.setVisible(True)
         self.set_buttons_enabled(False)
-        self.status_text.append(f"\n{message}")
+        self.status_text.appendPlainText(f"\n{message}")
     
     def stop_loading(self, success, message):
         """Hide progress bar and abort button."""
@@ -1657,15 +1676,18 @@ class PoseCreationTab(QWidget):
         self.btn_abort.setVisible(False)
         self.state_label.setVisible(False)
         self.set_buttons_enabled(True)
-        self.worker = None
+        # run() may still be returning when finished arrives; only drop the worker once its thread
+        # has exited, otherwise keep it until the next operation replaces it
+        if self.worker is not None and self.worker.wait(WORKER_EXIT_WAIT_MS):
+            self.worker = None
         if success:
-            self.status_text.append(f"✓ {message}")
+            self.status_text.appendPlainText(f"✓ {message}")
         else:
-            self.status_text.append(f"✗ {message}")
+            self.status_text.appendPlainText(f"✗ {message}")
 
     def append_log(self, text):
         """Append text to log."""
-        self.status_text.append(text)
+        self.status_text.appendPlainText(text)
 
     def _get_exe(self):
         """Get the SuspensionTools executable path."""
@@ -1682,9 +1704,9 @@ class PoseCreationTab(QWidget):
             for line in result.stdout.splitlines():
                 if line.startswith("POSE:"):
                     self.pose_list.addItem(line[5:])
-            self.status_text.append(f"✓ Found {self.pose_list.count()} pose(s)")
+            self.status_text.appendPlainText(f"✓ Found {self.pose_list.count()} pose(s)")
         except Exception as e:
-            self.status_text.append(f"✗ Could not list poses: {e}")
+            self.status_text.appendPlainText(f"✗ Could not list poses: {e}")
 
     def delete_selected_pose(self):
         """Delete the selected pose from SolidWorks."""
@@ -1727,8 +1749,8 @@ class PoseCreationTab(QWidget):
                 process.terminate()
                 return False
             line = line.strip()
-            if line and worker:
-                worker.log.emit(line)
+            if line:
+                print(line)
         process.wait()
         if process.returncode != 0:
             raise Exception(f"Command failed with exit code {process.returncode}")
@@ -1743,22 +1765,24 @@ class PoseCreationTab(QWidget):
     def test_solidworks_connection(self):
         """Test SolidWorks connection and print active assembly/configuration."""
         try:
+            from test_solidworks_connection import get_active_assembly_and_configuration
             assembly_name, config_name = get_active_assembly_and_configuration()
-            self.status_text.append("✓ SolidWorks connection successful")
-            self.status_text.append(f"✓ Active assembly: {assembly_name}")
-            self.status_text.append(f"✓ Active configuration: {config_name}")
+            self.status_text.appendPlainText("✓ SolidWorks connection successful")
+            self.status_text.appendPlainText(f"✓ Active assembly: {assembly_name}")
+            self.status_text.appendPlainText(f"✓ Active configuration: {config_name}")
         except Exception as e:
-            self.status_text.append(f"✗ Connection failed: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Connection failed: {str(e)}")
 
     def abort_operation(self):
         """Abort the current operation."""
         if self.worker:
-            self.status_text.append("Aborting operation...")
+            self.status_text.appendPlainText("Aborting operation...")
             self.worker.abort()
 
     def browse_json_file(self):
         """Browse for JSON file."""
-        file_path = QFileDialog.getOpenFileName(self, "Select JSON File", filter="*.json")[0]
+        file_path = QFileDialog.getOpenFileName(self, "Select JSON File", filter="*.json",
+                                                options=FILE_DIALOG_OPTIONS)[0]
         if file_path:
             self.json_path.setText(file_path)
 
@@ -1775,7 +1799,7 @@ class PoseCreationTab(QWidget):
             QMessageBox.warning(self, "Warning", "Pose name cannot be empty")
             return
 
-        if not re.match(r"^[a-zA-Z0-9_\- ]+$", pose_name):
+        if not POSE_NAME_RE.match(pose_name):
             QMessageBox.warning(self, "Invalid Name",
                 "Pose name can only contain letters, numbers, spaces, hyphens and underscores")
             return
@@ -1786,7 +1810,7 @@ class PoseCreationTab(QWidget):
             return
 
         inboard_json = os.path.join(project_path, "Inboard.json")
-        if not os.path.exists(inboard_json):
+        if not os.path.isfile(inboard_json):
             QMessageBox.warning(self, "Missing File",
                                 "Inboard.json not found in project folder. Parse an Excel file first.")
             return
@@ -1809,12 +1833,11 @@ class PoseCreationTab(QWidget):
             return
         
         try:
-            from pose_creation import create_pose_folder
             folder_path = create_pose_folder(pose_name)
-            self.status_text.append(f"✓ Created transforms folder: {folder_path}")
+            self.status_text.appendPlainText(f"✓ Created transforms folder: {folder_path}")
             QMessageBox.information(self, "Success", f"Created transforms folder: {folder_path}")
         except Exception as e:
-            self.status_text.append(f"✗ Error creating folder: {str(e)}")
+            self.status_text.appendPlainText(f"✗ Error creating folder: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to create folder: {str(e)}")
     
 
@@ -1822,13 +1845,29 @@ class PoseCreationTab(QWidget):
 
 class VisualizationControlTab(QWidget):
     """Tab for controlling visualization with color-coded buttons."""
-    
+
+    # Clicks within this window are sent together; repeated clicks on one target keep only the last
+    COMMAND_BATCH_MS = 80
+
+    # Suspension targets whose features all match 'all' too, so a queued 'all' overrides them.
+    # Chassis and substring filters can match features outside 'all' and are always kept.
+    COVERED_BY_ALL = frozenset({'front', 'rear', 'wheels', 'front_wheels', 'rear_wheels', 'non_chassis'})
+
     def __init__(self):
         super().__init__()
+        # One reused thread: commands stay off the GUI thread and reach SolidWorks in click order
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._pending = []  # (func, target, visible, filter_text)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.COMMAND_BATCH_MS)
+        self._flush_timer.timeout.connect(self._flush_commands)
         self.init_ui()
     
     def init_ui(self):
         layout = QVBoxLayout()
+        self.setStyleSheet(color_coding_stylesheet("QPushButton#Category_"))
         
         # Title
         layout.addWidget(QLabel("Visualization Controls"))
@@ -1839,11 +1878,11 @@ class VisualizationControlTab(QWidget):
         h_all = QHBoxLayout()
         
         btn_show_all = QPushButton("Show All")
-        btn_show_all.clicked.connect(lambda: self.set_suspension_visibility('all', True))
+        btn_show_all.clicked.connect(functools.partial(self.set_suspension_visibility, 'all', True, None))
         h_all.addWidget(btn_show_all)
         
         btn_hide_all = QPushButton("Hide All")
-        btn_hide_all.clicked.connect(lambda: self.set_suspension_visibility('all', False))
+        btn_hide_all.clicked.connect(functools.partial(self.set_suspension_visibility, 'all', False, None))
         h_all.addWidget(btn_hide_all)
         
         group_all.setLayout(h_all)
@@ -1854,19 +1893,19 @@ class VisualizationControlTab(QWidget):
         h_front_rear = QHBoxLayout()
         
         btn_show_front = QPushButton("Show Front")
-        btn_show_front.clicked.connect(lambda: self.set_suspension_visibility('front', True))
+        btn_show_front.clicked.connect(functools.partial(self.set_suspension_visibility, 'front', True, None))
         h_front_rear.addWidget(btn_show_front)
         
         btn_hide_front = QPushButton("Hide Front")
-        btn_hide_front.clicked.connect(lambda: self.set_suspension_visibility('front', False))
+        btn_hide_front.clicked.connect(functools.partial(self.set_suspension_visibility, 'front', False, None))
         h_front_rear.addWidget(btn_hide_front)
         
         btn_show_rear = QPushButton("Show Rear")
-        btn_show_rear.clicked.connect(lambda: self.set_suspension_visibility('rear', True))
+        btn_show_rear.clicked.connect(functools.partial(self.set_suspension_visibility, 'rear', True, None))
         h_front_rear.addWidget(btn_show_rear)
         
         btn_hide_rear = QPushButton("Hide Rear")
-        btn_hide_rear.clicked.connect(lambda: self.set_suspension_visibility('rear', False))
+        btn_hide_rear.clicked.connect(functools.partial(self.set_suspension_visibility, 'rear', False, None))
         h_front_rear.addWidget(btn_hide_rear)
         
         group_front_rear.setLayout(h_front_rear)
@@ -1877,43 +1916,43 @@ class VisualizationControlTab(QWidget):
         grid_wheels_chassis = QGridLayout()
 
         btn_show_wheels = QPushButton("Show Wheels")
-        btn_show_wheels.clicked.connect(lambda: self.set_suspension_visibility('wheels', True))
+        btn_show_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'wheels', True, None))
         grid_wheels_chassis.addWidget(btn_show_wheels, 0, 0)
 
         btn_hide_wheels = QPushButton("Hide Wheels")
-        btn_hide_wheels.clicked.connect(lambda: self.set_suspension_visibility('wheels', False))
+        btn_hide_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'wheels', False, None))
         grid_wheels_chassis.addWidget(btn_hide_wheels, 0, 1)
 
         btn_show_front_wheels = QPushButton("Show Front Wheels")
-        btn_show_front_wheels.clicked.connect(lambda: self.set_suspension_visibility('front_wheels', True))
+        btn_show_front_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'front_wheels', True, None))
         grid_wheels_chassis.addWidget(btn_show_front_wheels, 1, 0)
 
         btn_hide_front_wheels = QPushButton("Hide Front Wheels")
-        btn_hide_front_wheels.clicked.connect(lambda: self.set_suspension_visibility('front_wheels', False))
+        btn_hide_front_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'front_wheels', False, None))
         grid_wheels_chassis.addWidget(btn_hide_front_wheels, 1, 1)
 
         btn_show_rear_wheels = QPushButton("Show Rear Wheels")
-        btn_show_rear_wheels.clicked.connect(lambda: self.set_suspension_visibility('rear_wheels', True))
+        btn_show_rear_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'rear_wheels', True, None))
         grid_wheels_chassis.addWidget(btn_show_rear_wheels, 2, 0)
 
         btn_hide_rear_wheels = QPushButton("Hide Rear Wheels")
-        btn_hide_rear_wheels.clicked.connect(lambda: self.set_suspension_visibility('rear_wheels', False))
+        btn_hide_rear_wheels.clicked.connect(functools.partial(self.set_suspension_visibility, 'rear_wheels', False, None))
         grid_wheels_chassis.addWidget(btn_hide_rear_wheels, 2, 1)
 
         btn_show_chassis = QPushButton("Show Chassis")
-        btn_show_chassis.clicked.connect(lambda: self.set_suspension_visibility('chassis', True))
+        btn_show_chassis.clicked.connect(functools.partial(self.set_suspension_visibility, 'chassis', True, None))
         grid_wheels_chassis.addWidget(btn_show_chassis, 3, 0)
 
         btn_hide_chassis = QPushButton("Hide Chassis")
-        btn_hide_chassis.clicked.connect(lambda: self.set_suspension_visibility('chassis', False))
+        btn_hide_chassis.clicked.connect(functools.partial(self.set_suspension_visibility, 'chassis', False, None))
         grid_wheels_chassis.addWidget(btn_hide_chassis, 3, 1)
 
         btn_show_non_chassis = QPushButton("Show Non-Chassis")
-        btn_show_non_chassis.clicked.connect(lambda: self.set_suspension_visibility('non_chassis', True))
+        btn_show_non_chassis.clicked.connect(functools.partial(self.set_suspension_visibility, 'non_chassis', True, None))
         grid_wheels_chassis.addWidget(btn_show_non_chassis, 4, 0)
 
         btn_hide_non_chassis = QPushButton("Hide Non-Chassis")
-        btn_hide_non_chassis.clicked.connect(lambda: self.set_suspension_visibility('non_chassis', False))
+        btn_hide_non_chassis.clicked.connect(functools.partial(self.set_suspension_visibility, 'non_chassis', False, None))
         grid_wheels_chassis.addWidget(btn_hide_non_chassis, 4, 1)
 
         group_wheels_chassis.setLayout(grid_wheels_chassis)
@@ -1932,13 +1971,13 @@ class VisualizationControlTab(QWidget):
             h_category = QHBoxLayout()
             
             btn_show = QPushButton(f"Show {info['name']}")
-            btn_show.setStyleSheet(f"background-color: rgb({info['rgb'][0]}, {info['rgb'][1]}, {info['rgb'][2]}); color: white;")
-            btn_show.clicked.connect(lambda _checked=False, p=prefix: self.set_suspension_visibility('substring', True, p))
+            btn_show.setObjectName(f"Category_{prefix}")
+            btn_show.clicked.connect(functools.partial(self.set_suspension_visibility, 'substring', True, prefix))
             h_category.addWidget(btn_show)
             
             btn_hide = QPushButton(f"Hide {info['name']}")
-            btn_hide.setStyleSheet(f"background-color: rgb({info['rgb'][0]}, {info['rgb'][1]}, {info['rgb'][2]}); color: white;")
-            btn_hide.clicked.connect(lambda _checked=False, p=prefix: self.set_suspension_visibility('substring', False, p))
+            btn_hide.setObjectName(f"Category_{prefix}")
+            btn_hide.clicked.connect(functools.partial(self.set_suspension_visibility, 'substring', False, prefix))
             h_category.addWidget(btn_hide)
             
             layout_categories.addLayout(h_category)
@@ -1952,29 +1991,29 @@ class VisualizationControlTab(QWidget):
         
         h_markers_all = QHBoxLayout()
         btn_show_markers_all = QPushButton("Show All Markers")
-        btn_show_markers_all.clicked.connect(lambda: self.set_marker_visibility('all', True))
+        btn_show_markers_all.clicked.connect(functools.partial(self.set_marker_visibility, 'all', True, None))
         h_markers_all.addWidget(btn_show_markers_all)
         
         btn_hide_markers_all = QPushButton("Hide All Markers")
-        btn_hide_markers_all.clicked.connect(lambda: self.set_marker_visibility('all', False))
+        btn_hide_markers_all.clicked.connect(functools.partial(self.set_marker_visibility, 'all', False, None))
         h_markers_all.addWidget(btn_hide_markers_all)
         layout_markers.addLayout(h_markers_all)
         
         h_markers_front_rear = QHBoxLayout()
         btn_show_markers_front = QPushButton("Show Front Markers")
-        btn_show_markers_front.clicked.connect(lambda: self.set_marker_visibility('front', True))
+        btn_show_markers_front.clicked.connect(functools.partial(self.set_marker_visibility, 'front', True, None))
         h_markers_front_rear.addWidget(btn_show_markers_front)
         
         btn_hide_markers_front = QPushButton("Hide Front Markers")
-        btn_hide_markers_front.clicked.connect(lambda: self.set_marker_visibility('front', False))
+        btn_hide_markers_front.clicked.connect(functools.partial(self.set_marker_visibility, 'front', False, None))
         h_markers_front_rear.addWidget(btn_hide_markers_front)
         
         btn_show_markers_rear = QPushButton("Show Rear Markers")
-        btn_show_markers_rear.clicked.connect(lambda: self.set_marker_visibility('rear', True))
+        btn_show_markers_rear.clicked.connect(functools.partial(self.set_marker_visibility, 'rear', True, None))
         h_markers_front_rear.addWidget(btn_show_markers_rear)
         
         btn_hide_markers_rear = QPushButton("Hide Rear Markers")
-        btn_hide_markers_rear.clicked.connect(lambda: self.set_marker_visibility('rear', False))
+        btn_hide_markers_rear.clicked.connect(functools.partial(self.set_marker_visibility, 'rear', False, None))
         h_markers_front_rear.addWidget(btn_hide_markers_rear)
         layout_markers.addLayout(h_markers_front_rear)
         
@@ -1983,15 +2022,17 @@ class VisualizationControlTab(QWidget):
         
         # Console output
         layout.addWidget(QLabel("Output:"))
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setReadOnly(True)
-        self.status_text.setFontFamily("Courier")
+        self.status_text.setUndoRedoEnabled(False)
+        self.status_text.setMaximumBlockCount(MAX_LOG_LINES)
+        self.status_text.setFont(QFont("Courier"))
         self.status_text.setMaximumHeight(100)
-        self.status_text.setText("Ready")
+        self.status_text.setPlainText("Ready")
         layout.addWidget(self.status_text)
         
         btn_clear = QPushButton("Clear Log")
-        btn_clear.clicked.connect(lambda: self.status_text.clear())
+        btn_clear.clicked.connect(self.status_text.clear)
         layout.addWidget(btn_clear)
         
         layout.addStretch()
@@ -1999,27 +2040,44 @@ class VisualizationControlTab(QWidget):
     
     def set_suspension_visibility(self, target, visible, filter_text=None, *extra_args):
         """Set suspension visibility."""
-        try:
-            # Backward compatibility for older tie-rod token naming.
-            if isinstance(filter_text, str) and filter_text.upper().startswith("TIER"):
-                filter_text = "TiePnt"
+        # Backward compatibility for older tie-rod token naming.
+        if isinstance(filter_text, str) and filter_text.upper().startswith("TIER"):
+            filter_text = "TiePnt"
+        self._run_command(set_suspension_visibility, target, visible, filter_text)
 
-            success = set_suspension_visibility(target, visible, filter_text)
-            action = "Showing" if visible else "Hiding"
-            target_text = f"{target} ({filter_text})" if filter_text else target
-            self.status_text.append(f"{action} {target_text}... {'✓ Done' if success else '✗ Failed'}")
-        except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
-    
-    def set_marker_visibility(self, target, visible, filter_text=None):
+    def set_marker_visibility(self, target, visible, filter_text=None, _checked=False):
         """Set marker visibility."""
-        try:
-            success = set_marker_visibility(target, visible, filter_text)
+        self._run_command(set_marker_visibility, target, visible, filter_text)
+
+    def _run_command(self, func, target, visible, filter_text):
+        """Queue a visibility command; queued commands are sent after a short delay."""
+        if func is set_suspension_visibility and target == 'all':
+            # Show/Hide All sets everything the narrower queued commands would have
+            self._pending = [cmd for cmd in self._pending
+                             if not (cmd[0] is func and cmd[1] in self.COVERED_BY_ALL)]
+        if self._pending and self._pending[-1][:2] == (func, target) and self._pending[-1][3] == filter_text:
+            # Show/hide of the same target clicked again: only the last state matters
+            self._pending[-1] = (func, target, visible, filter_text)
+        else:
+            self._pending.append((func, target, visible, filter_text))
+        self._flush_timer.start()
+
+    def _flush_commands(self):
+        """Submit the queued visibility commands to the tab's thread pool."""
+        pending, self._pending = self._pending, []
+        for func, target, visible, filter_text in pending:
             action = "Showing" if visible else "Hiding"
             target_text = f"{target} ({filter_text})" if filter_text else target
-            self.status_text.append(f"{action} {target_text}... {'✓ Done' if success else '✗ Failed'}")
-        except Exception as e:
-            self.status_text.append(f"✗ Error: {str(e)}")
+            runnable = CommandRunnable(f"{action} {target_text}...", func, target, visible, filter_text)
+            runnable.signals.finished.connect(self._on_command_finished)
+            runnable.signals.failed.connect(self._on_command_failed)
+            self.pool.start(runnable)
+
+    def _on_command_finished(self, description, success):
+        self.status_text.appendPlainText(f"{description} {'✓ Done' if success else '✗ Failed'}")
+
+    def _on_command_failed(self, description, error):
+        self.status_text.appendPlainText(f"✗ Error: {str(error)}")
 
 class HelpTab(QWidget):
     def __init__(self):
@@ -2052,6 +2110,19 @@ def get_project_path(widget):
 
 
 class SolidworksOptKPluginApp(QMainWindow):
+    # Only the first tab is built at startup; the rest are built on first visit
+    TABS = [
+        (ProjectTab, "Project"),
+        (ImportOptimumKTab, "Parse"),
+        (CoordinateInsertionTab, "Insert Coordinates"),
+        (PoseCreationTab, "Write Pose"),
+        (VisualizationControlTab, "Visualization"),
+        (HelpTab, "Help"),
+    ]
+
+    # Longest closeEvent waits for each thread or pool that can't be aborted
+    CLOSE_WAIT_MS = 3000
+
     def __init__(self):
         super().__init__()
         self.project_path = None
@@ -2061,16 +2132,58 @@ class SolidworksOptKPluginApp(QMainWindow):
         self.setWindowTitle("SolidworksOptKPlugin")
         self.setGeometry(100, 100, 700, 700)
 
-        tabs = QTabWidget()
-
-        tabs.addTab(ProjectTab(), "Project")
-        tabs.addTab(ImportOptimumKTab(), "Parse")
-        tabs.addTab(CoordinateInsertionTab(), "Insert Coordinates")
-        tabs.addTab(PoseCreationTab(), "Write Pose")
-        tabs.addTab(VisualizationControlTab(), "Visualization")
-        tabs.addTab(HelpTab(), "Help")
+        self.tabs = QTabWidget()
+        self._tab_factories = {}
+        for index, (factory, title) in enumerate(self.TABS):
+            if index == 0:
+                self.tabs.addTab(factory(), title)
+            else:
+                self.tabs.addTab(QWidget(), title)
+                self._tab_factories[index] = factory
+        self.tabs.currentChanged.connect(self._build_tab)
+
+        self.setCentralWidget(self.tabs)
+
+    def closeEvent(self, event):
+        """Stop or wait for running operations; keep the window open if one doesn't finish.
+
+        Destroying a QThread that is still running (e.g. mid-way through COM
+        calls into SolidWorks) would crash the app, so closing is refused instead.
+        """
+        finished = True
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            for name in ("worker", "parse_worker", "vis_worker"):
+                thread = getattr(tab, name, None)
+                if isinstance(thread, WorkerBase) and thread.isRunning():
+                    finished &= thread.stop()
+                elif isinstance(thread, QThread):
+                    # Import, Excel parse and visibility threads can't be aborted; let them finish
+                    finished &= thread.wait(self.CLOSE_WAIT_MS)
+            pool = getattr(tab, "pool", None)
+            if isinstance(pool, QThreadPool):
+                finished &= pool.waitForDone(self.CLOSE_WAIT_MS)
+        if not finished:
+            event.ignore()
+            QMessageBox.information(self, "Operation Running",
+                                    "An operation is still finishing in SolidWorks.\n\n"
+                                    "Wait for it to complete, then close the window again.")
+            return
+        super().closeEvent(event)
 
-        self.setCentralWidget(tabs)
+    def _build_tab(self, index):
+        """Replace a placeholder with its real tab the first time it is shown."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, factory(), title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,9 @@
 import os
 import sys
-import json
 import subprocess
 from PyQt5.QtWidgets import QMessageBox
 from workers import WorkerBase
-from utils import find_suspension_tools_exe, get_data_dir
+from utils import APP_DIR, find_suspension_tools_exe, get_data_dir, read_json, iter_output_blocks
 from solidworks_release import release_solidworks_command_state
 
 
@@ -41,9 +40,7 @@ def insert_coordinates(json_path, marker_path, worker=None, progress_callback=No
     process = subprocess.Popen(
         args,
         stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        stderr=subprocess.STDOUT
     )
     
     # Store process in worker for abort capability
@@ -52,13 +49,11 @@ def insert_coordinates(json_path, marker_path, worker=None, progress_callback=No
     elif progress_callback and hasattr(progress_callback, '_process'):
         progress_callback._process = process
     
-    # Stream output line by line
-    for line in process.stdout:
+    # Stream output in blocks of whole lines; the worker's stdout splits and parses them
+    for block in iter_output_blocks(process.stdout):
         if worker and worker._abort:
+            # The worker releases SolidWorks once the operation returns
             process.terminate()
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
             print("Operation aborted by user")
             return False
         elif progress_callback and hasattr(progress_callback, '_abort') and progress_callback._abort:
@@ -68,7 +63,7 @@ def insert_coordinates(json_path, marker_path, worker=None, progress_callback=No
                 print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
             print("Operation aborted by user")
             return False
-        print(line.rstrip())
+        print(block)
     
     process.wait()
     return process.returncode == 0
@@ -76,8 +71,7 @@ def insert_coordinates(json_path, marker_path, worker=None, progress_callback=No
 
 def load_json(file_path):
     """Load JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return read_json(file_path)
 
 
 def extract_hardpoints(json_data):
@@ -172,29 +166,32 @@ def extract_wheels(wheels_data, hardpoints):
         print(f"Warning: Could not extract wheel data: {e}")
 
 
+# Name substring -> marker RGB, checked in order; the first match wins, so the
+# component prefixes take precedence over the _FRONT/_REAR and wheel fallbacks.
+# Keys are stored upper-case once instead of per lookup.
+NAME_COLORS = tuple((key.upper(), color) for key, color in (
+    ("CHAS_", (255, 0, 0)),       # Red - Chassis
+    ("UPRI_", (0, 0, 255)),       # Blue - Upright
+    ("ROCK_", (0, 128, 255)),     # Light Blue - Rocker
+    ("NSMA_", (255, 192, 203)),   # Pink - Non-Sprung Mass
+    ("PUSH_", (0, 255, 0)),       # Green - Pushrod
+    ("TIER_", (255, 165, 0)),     # Orange - Tie Rod
+    ("DAMP_", (128, 0, 128)),     # Purple - Damper
+    ("ARBA_", (255, 255, 0)),     # Yellow - ARB
+    ("_FRONT", (0, 200, 200)),    # Cyan - Front
+    ("_REAR", (200, 100, 0)),     # Brown - Rear
+    ("wheel", (64, 64, 64)),      # Dark Gray - Wheels
+))
+DEFAULT_NAME_COLOR = (128, 128, 128)  # Gray default
+
+
 def get_color_for_name(name):
     """Get color RGB values based on name prefix."""
-    color_map = {
-        "CHAS_": [255, 0, 0],       # Red - Chassis
-        "UPRI_": [0, 0, 255],       # Blue - Upright
-        "ROCK_": [0, 128, 255],     # Light Blue - Rocker
-        "NSMA_": [255, 192, 203],   # Pink - Non-Sprung Mass
-        "PUSH_": [0, 255, 0],       # Green - Pushrod
-        "TIER_": [255, 165, 0],     # Orange - Tie Rod
-        "DAMP_": [128, 0, 128],     # Purple - Damper
-        "ARBA_": [255, 255, 0],     # Yellow - ARB
-        "_FRONT": [0, 200, 200],    # Cyan - Front
-        "_REAR": [200, 100, 0],     # Brown - Rear
-        "wheel": [64, 64, 64],      # Dark Gray - Wheels
-    }
-    
-    default_color = [128, 128, 128]  # Gray default
-    
     upper = name.upper()
-    for prefix, color in color_map.items():
-        if prefix.upper() in upper:
-            return color
-    return default_color
+    for key, color in NAME_COLORS:
+        if key in upper:
+            return list(color)
+    return list(DEFAULT_NAME_COLOR)
 
 
 def validate_files(json_path, marker_path):
@@ -238,7 +235,7 @@ def get_marker_path():
         ])
 
     # Development build: check script directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = APP_DIR
     marker_paths.extend([
         os.path.join(script_dir, "Marker.SLDPRT"),
         os.path.join(script_dir, "Marker.sldprt"),
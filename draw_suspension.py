@@ -1,26 +1,36 @@
-import json
 import os
 import subprocess
-from solidworks_release import release_solidworks_command_state
-from utils import find_suspension_tools_exe
+from utils import find_suspension_tools_exe, read_json
+from suspension_tools_client import run_tools_command
+
+
+# Decoded JSON keyed by path; an entry is reused only while the file's mtime is unchanged.
+_json_cache: dict[str, tuple[int, dict]] = {}
 
 
 def load_json(file_path):
-    """Load JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    """Load JSON file, reusing the previous decode if the file has not changed."""
+    mtime = os.stat(file_path).st_mtime_ns
+    cached = _json_cache.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = read_json(file_path)
+    _json_cache[file_path] = (mtime, data)
+    return data
+
+
+def _as_data(source):
+    """Return decoded JSON for either a file path or an already-loaded dict."""
+    return source if isinstance(source, dict) else load_json(source)
 
 
 def insert_coordinate_system(name, x, y, z, angle_x=0.0, angle_y=0.0, angle_z=0.0):
-    """Call C# SuspensionTools.exe via subprocess."""
-    exe = find_suspension_tools_exe()
-    args = [exe, name, str(x), str(y), str(z), str(angle_x), str(angle_y), str(angle_z)]
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
-    return result.returncode == 0
+    """Insert one coordinate system via SuspensionTools.exe.
+
+    Runs in the shared daemon process, so drawing a full suspension pays the
+    .NET startup and SolidWorks attach once rather than per coordinate system.
+    """
+    return run_tools_command(name, x, y, z, angle_x, angle_y, angle_z)
 
 
 def count_hardpoints(suspension_data: dict) -> int:
@@ -42,6 +52,26 @@ def count_wheels(wheels_data: dict) -> int:
     return 2 if wheels_data else 0
 
 
+def count_coordinate_systems(suspension_data: dict) -> int:
+    """Count hardpoint and wheel coordinate systems in suspension data."""
+    return count_hardpoints(suspension_data) + count_wheels(suspension_data.get("Wheels", {}))
+
+
+# Coordinate system counts keyed by path; an entry is reused only while the file's mtime is unchanged.
+_total_cache: dict[str, tuple[int, int]] = {}
+
+
+def suspension_total(file_path: str) -> int:
+    """Return the coordinate system count for a suspension JSON file, memoized per file mtime."""
+    mtime = os.stat(file_path).st_mtime_ns
+    cached = _total_cache.get(file_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    total = count_coordinate_systems(load_json(file_path))
+    _total_cache[file_path] = (mtime, total)
+    return total
+
+
 def InsertHardpoint(suspension_data: dict, suffix: str, x_offset: float = 0.0, progress_callback=None):
     """Insert all hardpoints from suspension data as coordinate systems."""
     for section_name, section_data in suspension_data.items():
@@ -97,10 +127,10 @@ def InsertWheel(wheels_data: dict, reference_distance: float, is_rear: bool, pro
         print(f"Error inserting wheels: {e}")
 
 
-def draw_front_suspension(front_suspension_path: str, progress_callback=None):
-    """Draw front suspension from JSON file. Returns total coordinate systems inserted."""
-    front_data = load_json(front_suspension_path)
-    total = count_hardpoints(front_data) + count_wheels(front_data.get("Wheels", {}))
+def draw_front_suspension(front_suspension_path, progress_callback=None):
+    """Draw front suspension from a JSON file path or loaded dict. Returns total coordinate systems inserted."""
+    front_data = _as_data(front_suspension_path)
+    total = count_coordinate_systems(front_data)
     
     print("=== Inserting Front Hardpoints ===")
     InsertHardpoint(front_data, "_FRONT", x_offset=0.0, progress_callback=progress_callback)
@@ -111,13 +141,13 @@ def draw_front_suspension(front_suspension_path: str, progress_callback=None):
     return total
 
 
-def draw_rear_suspension(rear_suspension_path: str, vehicle_setup_path: str, progress_callback=None):
-    """Draw rear suspension from JSON file with reference distance offset. Returns total coordinate systems inserted."""
-    rear_data = load_json(rear_suspension_path)
-    vehicle_data = load_json(vehicle_setup_path)
+def draw_rear_suspension(rear_suspension_path, vehicle_setup_path, progress_callback=None):
+    """Draw rear suspension from JSON file paths or loaded dicts with reference distance offset. Returns total coordinate systems inserted."""
+    rear_data = _as_data(rear_suspension_path)
+    vehicle_data = _as_data(vehicle_setup_path)
     
     reference_distance = -float(vehicle_data.get("Reference distance", 0.0))
-    total = count_hardpoints(rear_data) + count_wheels(rear_data.get("Wheels", {}))
+    total = count_coordinate_systems(rear_data)
     
     print("=== Inserting Rear Hardpoints ===")
     InsertHardpoint(rear_data, "_REAR", x_offset=reference_distance, progress_callback=progress_callback)
@@ -128,8 +158,8 @@ def draw_rear_suspension(rear_suspension_path: str, vehicle_setup_path: str, pro
     return total
 
 
-def draw_full_suspension(front_path: str, rear_path: str, vehicle_setup_path: str, progress_callback=None):
-    """Draw complete suspension from all JSON files. Returns total coordinate systems inserted."""
+def draw_full_suspension(front_path, rear_path, vehicle_setup_path, progress_callback=None):
+    """Draw complete suspension from JSON file paths or loaded dicts. Returns total coordinate systems inserted."""
     front_total = draw_front_suspension(front_path, progress_callback=progress_callback)
     rear_total = draw_rear_suspension(rear_path, vehicle_setup_path, progress_callback=progress_callback)
     return front_total + rear_total
@@ -138,19 +168,12 @@ def draw_full_suspension(front_path: str, rear_path: str, vehicle_setup_path: st
 # ==================== Visibility Control Functions ====================
 
 def _run_visibility_command(command: str, visible: bool, parameter: str = None) -> bool:
-    """Run SuspensionTools.exe visibility command via subprocess."""
-    exe = find_suspension_tools_exe()
+    """Run SuspensionTools.exe visibility command through the shared daemon process."""
     vis_str = "show" if visible else "hide"
-    args = [exe, "vis", command, vis_str]
+    args = ["vis", command, vis_str]
     if parameter:
         args.append(parameter)
-    
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
-    return result.returncode == 0
+    return run_tools_command(*args)
 
 
 def set_feature_visibility(feature_name: str, visible: bool) -> bool:
@@ -206,15 +229,8 @@ def set_visibility_by_substring(substring: str, visible: bool) -> bool:
 # ==================== Marker Control Functions ====================
 
 def _run_marker_command(*args) -> bool:
-    """Run SuspensionTools.exe marker command via subprocess."""
-    exe = find_suspension_tools_exe()
-    cmd_args = [exe, "marker"] + list(args)
-    result = subprocess.run(cmd_args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
-    return result.returncode == 0
+    """Run SuspensionTools.exe marker command through the shared daemon process."""
+    return run_tools_command("marker", *args)
 
 
 def create_all_markers(radius_mm: float = 5.0) -> bool:
@@ -274,10 +290,8 @@ def create_all_markers_with_worker(radius_mm, worker=None):
     # Stream output line by line
     for line in process.stdout:
         if worker and worker._abort:
+            # The worker releases SolidWorks once the operation returns
             process.terminate()
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
             print("Operation aborted by user")
             return False
         print(line.rstrip())
@@ -308,10 +322,8 @@ def delete_all_markers_with_worker(worker=None):
     # Stream output line by line
     for line in process.stdout:
         if worker and worker._abort:
+            # The worker releases SolidWorks once the operation returns
             process.terminate()
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
             print("Operation aborted by user")
             return False
         print(line.rstrip())
@@ -3,6 +3,7 @@ import json
 from datetime import datetime
 from typing import Any
 import openpyxl
+from utils import write_json
 
 
 
@@ -14,17 +15,34 @@ class OptimumSheetParser:
     """
     def __init__(self, file_path: str):
         self.file_path = pathlib.Path(file_path)
-        self.workbook = openpyxl.load_workbook(self.file_path, data_only=True)
-
-    def parse(self) -> dict:
-        result = {}
-        for sheet_name in self.workbook.sheetnames:
-            sheet = self.workbook[sheet_name]
-            result[sheet_name] = self._parse_sheet(sheet)
-        return result
-
-    def _parse_sheet(self, sheet) -> dict:
-        rows = list(sheet.iter_rows(values_only=True))
+        # Stream the workbook once in read-only mode and keep only the cell values;
+        # every later pass works from these rows instead of the openpyxl object model.
+        workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            self.sheet_rows = {
+                sheet_name: list(workbook[sheet_name].iter_rows(values_only=True))
+                for sheet_name in workbook.sheetnames
+            }
+        finally:
+            workbook.close()
+        self._parsed = None
+
+    def parse(self, progress_callback=None) -> dict:
+        """
+        Parse every sheet. progress_callback(done, total) is called after each sheet.
+        """
+        # The rows are fixed once loaded, so the save_* methods share one parse.
+        if self._parsed is None:
+            result = {}
+            total = len(self.sheet_rows)
+            for i, (sheet_name, rows) in enumerate(self.sheet_rows.items(), 1):
+                result[sheet_name] = self._parse_sheet(rows)
+                if progress_callback:
+                    progress_callback(i, total)
+            self._parsed = result
+        return self._parsed
+
+    def _parse_sheet(self, rows) -> dict:
         blocks = self._find_blocks(rows)
         parsed = {}
         for block in blocks:
@@ -179,9 +197,7 @@ class OptimumSheetParser:
                 continue  # Skip setup sheets
             # Clean filename: replace spaces with underscores
             fname = f"{sheet_name.replace(' ', '_')}.json"
-            out_path = base_dir / fname
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(sheet_data, f, indent=2, default=str)
+            self._write_json(base_dir / fname, sheet_data)
         print(f"Saved {len([s for s in parsed if 'setup' not in s.lower()])} sheets to {base_dir}")
 
     def parse_reference_distance(self) -> dict:
@@ -190,10 +206,9 @@ class OptimumSheetParser:
         Looks for a sheet or block named 'Setup' or 'Vehicle Setup', or a cell with 'Reference distance'.
         """
         # First, prioritize sheets with 'setup' in the name
-        setup_sheets = [sheet_name for sheet_name in self.workbook.sheetnames if 'setup' in sheet_name.lower()]
+        setup_sheets = [sheet_name for sheet_name in self.sheet_rows if 'setup' in sheet_name.lower()]
         for sheet_name in setup_sheets:
-            sheet = self.workbook[sheet_name]
-            for row in sheet.iter_rows(values_only=True):
+            for row in self.sheet_rows[sheet_name]:
                 for i, cell in enumerate(row):
                     if isinstance(cell, str) and 'reference distance' in cell.lower():
                         # Try to get the value from the next cell in the row
@@ -205,9 +220,8 @@ class OptimumSheetParser:
                                 val = None
                             return {"Reference distance": val}
         # If not found in setup sheets, search all sheets
-        for sheet_name in self.workbook.sheetnames:
-            sheet = self.workbook[sheet_name]
-            for row in sheet.iter_rows(values_only=True):
+        for rows in self.sheet_rows.values():
+            for row in rows:
                 for i, cell in enumerate(row):
                     if isinstance(cell, str) and 'reference distance' in cell.lower():
                         # Try to get the value from the next cell in the row
@@ -329,8 +343,8 @@ class OptimumSheetParser:
 
     @staticmethod
     def _write_json(path: pathlib.Path, data: dict):
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        # Indented: these files are opened by users and shown in the Parse tab preview
+        write_json(path, data, indent=True)
 
     def save_reference_distance(self, results_dir: str = "results"):
         """
@@ -340,8 +354,7 @@ class OptimumSheetParser:
         base_dir = pathlib.Path(results_dir)
         base_dir.mkdir(parents=True, exist_ok=True)
         out_path = base_dir / "Vehicle_Setup.json"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(ref_dist, f, indent=2, default=str)
+        self._write_json(out_path, ref_dist)
         print(f"Reference distance saved to {out_path}")
 
 
@@ -1,8 +1,7 @@
 import os
-import json
 import subprocess
 from workers import WorkerBase
-from utils import find_suspension_tools_exe, get_data_dir
+from utils import find_suspension_tools_exe, get_data_dir, read_json
 from solidworks_release import release_solidworks_command_state
 
 
@@ -48,10 +47,8 @@ def insert_pose(json_path, pose_name, worker=None, progress_callback=None):
     # Stream output line by line
     for line in process.stdout:
         if worker and worker._abort:
+            # The worker releases SolidWorks once the operation returns
             process.terminate()
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
             print("Operation aborted by user")
             return False
         elif progress_callback and hasattr(progress_callback, '_abort') and progress_callback._abort:
@@ -74,8 +71,7 @@ def create_pose(json_path, pose_name, worker=None, progress_callback=None):
 
 def load_json(file_path):
     """Load JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return read_json(file_path)
 
 
 def extract_hardpoints_for_pose(json_data):
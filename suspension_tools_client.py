@@ -0,0 +1,164 @@
+import atexit
+import subprocess
+import threading
+from utils import find_suspension_tools_exe
+
+# Printed by SuspensionTools.exe --daemon after each command, followed by its exit code
+DONE_PREFIX = "DONE:"
+
+
+class CommandInterrupted(Exception):
+    """The daemon exited after receiving a command but before finishing it."""
+
+    def __init__(self, message, output):
+        super().__init__(message)
+        self.output = output  # lines printed before the daemon exited
+
+
+class SuspensionToolsClient:
+    """
+    Keeps one SuspensionTools.exe --daemon process running and sends it commands.
+
+    Each command is written as one tab-separated line on stdin; the daemon replies
+    with the command's output and a DONE:<exit code> line. This avoids paying the
+    .NET startup cost for every short command such as a visibility toggle.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._exe_path = None
+        self._lock = threading.Lock()
+        self._daemon_worked = False  # any command ever completed through a daemon
+        self._unsupported = False
+
+    def _ensure_started(self):
+        exe_path = find_suspension_tools_exe()
+        if self._proc is not None and (self._proc.poll() is not None or exe_path != self._exe_path):
+            self._stop()
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                [exe_path, "--daemon"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+            self._exe_path = exe_path
+        return self._proc
+
+    def run(self, *args):
+        """
+        Run one command in the daemon.
+
+        Returns:
+            (returncode: int, output: list[str])
+
+        Raises OSError if the daemon can't be used (not built, exited, or an older
+        build without --daemon) and the command was not run; callers fall back to
+        a one-off subprocess. Raises CommandInterrupted if the daemon exited part
+        way through the command, which must not be re-run.
+        """
+        args = [str(a) for a in args]
+        if any("\t" in a or "\n" in a for a in args):
+            raise ValueError("Daemon commands can't contain tabs or newlines")
+
+        with self._lock:
+            if self._unsupported:
+                raise OSError("SuspensionTools.exe does not support --daemon")
+            proc = self._ensure_started()
+            try:
+                proc.stdin.write("\t".join(args) + "\n")
+                proc.stdin.flush()
+            except OSError:
+                # The command never reached the daemon
+                self._daemon_exited()
+                raise BrokenPipeError("SuspensionTools.exe daemon exited")
+
+            output = []
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip("\r\n")
+                    if line.startswith(DONE_PREFIX):
+                        self._daemon_worked = True
+                        return int(line[len(DONE_PREFIX):]), output
+                    output.append(line)
+            except (OSError, ValueError):
+                # Broken pipe or a malformed DONE line; handled like stdout closing below
+                pass
+
+            # stdout closed before DONE: the process exited
+            if self._daemon_exited():
+                # An older build printed its usage and exited without running anything
+                raise OSError("SuspensionTools.exe does not support --daemon")
+            raise CommandInterrupted("SuspensionTools.exe daemon exited while running the command", output)
+
+    def _daemon_exited(self):
+        """Stop the dead daemon; return True if it has never completed a command (unsupported build)."""
+        if not self._daemon_worked:
+            self._unsupported = True
+        self._stop()
+        return self._unsupported
+
+    def _stop(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def close(self):
+        """Shut down the daemon process, if running."""
+        with self._lock:
+            self._stop()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the shared SuspensionToolsClient, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = SuspensionToolsClient()
+            atexit.register(_client.close)
+        return _client
+
+
+def run_tools_command(*args):
+    """
+    Run a SuspensionTools.exe command, preferring the shared daemon process.
+
+    Prints the command's output like the one-off subprocess calls do and returns
+    True on a zero exit code.
+    """
+    args = [str(a) for a in args]
+    try:
+        returncode, output = get_client().run(*args)
+        text = "\n".join(output).strip()
+        if text:
+            print(text)
+        return returncode == 0
+    except CommandInterrupted as e:
+        # The command may have partly run (e.g. inserted a coordinate system); don't repeat it
+        text = "\n".join(e.output).strip()
+        if text:
+            print(text)
+        print(f"Error: {e}")
+        return False
+    except (OSError, ValueError):
+        pass
+
+    # Daemon unavailable; run the command as its own process
+    exe = find_suspension_tools_exe()
+    result = subprocess.run([exe, *args], capture_output=True, text=True)
+    if result.stdout:
+        print(result.stdout.strip())
+    if result.returncode != 0 and result.stderr:
+        print(result.stderr.strip())
+    return result.returncode == 0
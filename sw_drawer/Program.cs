@@ -7,8 +7,40 @@ namespace sw_drawer
 {
     class Program
     {
+        // Daemon mode: each stdin line is one tab-separated command; its output is followed by this prefix and the exit code
+        const string DaemonDonePrefix = "DONE:";
+
         [STAThread]
         static int Main(string[] args)
+        {
+            if (args.Length == 1 && args[0] == "--daemon")
+            {
+                return RunDaemon();
+            }
+
+            return RunCommand(args);
+        }
+
+        static int RunDaemon()
+        {
+            string line;
+            while ((line = Console.In.ReadLine()) != null)
+            {
+                if (line.Length == 0)
+                {
+                    continue;
+                }
+
+                string[] commandArgs = line.Split('\t');
+                int exitCode = commandArgs[0] == "--daemon" ? 1 : RunCommand(commandArgs);
+                Console.WriteLine($"{DaemonDonePrefix}{exitCode}");
+                Console.Out.Flush();
+            }
+
+            return 0;
+        }
+
+        static int RunCommand(string[] args)
         {
             if (args.Length == 0)
             {
@@ -145,6 +177,7 @@ namespace sw_drawer
             Console.WriteLine("  SuspensionTools.exe marker <command> [args]            - Marker operations");
             Console.WriteLine("  SuspensionTools.exe vis <command> [args]               - Visibility control");
             Console.WriteLine("  SuspensionTools.exe release                            - Release SolidWorks command state");
+            Console.WriteLine("  SuspensionTools.exe --daemon                           - Read tab-separated commands from stdin");
         }
 
         static bool RunReleaseCommand()
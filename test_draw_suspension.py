@@ -0,0 +1,40 @@
+"""Tests for draw_suspension helpers that don't need SolidWorks running."""
+
+import subprocess
+import unittest
+from unittest import mock
+
+import draw_suspension
+import suspension_tools_client
+
+
+class InsertCoordinateSystemTest(unittest.TestCase):
+    """insert_coordinate_system passes float coordinates to SuspensionTools.exe."""
+
+    def test_fallback_process_gets_string_args(self):
+        client = mock.Mock()
+        client.run.side_effect = OSError("daemon unavailable")
+        completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+        with mock.patch.object(suspension_tools_client, "get_client", return_value=client), \
+                mock.patch.object(suspension_tools_client, "find_suspension_tools_exe",
+                                  return_value="SuspensionTools.exe"), \
+                mock.patch.object(suspension_tools_client.subprocess, "run",
+                                  return_value=completed) as run:
+            ok = draw_suspension.insert_coordinate_system("FL_wheel", 1.5, -2.0, 3.25, 0.5, 0.0, -0.5)
+
+        self.assertTrue(ok)
+        cmd = run.call_args[0][0]
+        self.assertEqual(cmd, ["SuspensionTools.exe", "FL_wheel", "1.5", "-2.0", "3.25", "0.5", "0.0", "-0.5"])
+
+    def test_daemon_gets_string_args(self):
+        client = mock.Mock()
+        client.run.return_value = (0, [])
+        with mock.patch.object(suspension_tools_client, "get_client", return_value=client):
+            ok = draw_suspension.insert_coordinate_system("CHAS_upper_FRONT", 100.0, 200.0, 300.0)
+
+        self.assertTrue(ok)
+        client.run.assert_called_once_with("CHAS_upper_FRONT", "100.0", "200.0", "300.0", "0.0", "0.0", "0.0")
+
+
+if __name__ == "__main__":
+    unittest.main()
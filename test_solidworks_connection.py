@@ -1,5 +1,6 @@
 import sys
 import os
+import functools
 
 
 def _read_com_member(obj, *member_names):
@@ -36,24 +37,35 @@ def _get_doc_type(active_doc):
     return _read_com_member(active_doc, "GetType", "Type")
 
 
-def get_active_document_name():
-    """Get the name of the active document in SolidWorks."""
+@functools.lru_cache(maxsize=1)
+def _get_sw_app():
+    """Return the SolidWorks COM application, dispatched once and reused."""
     import win32com.client
-    sw_app = win32com.client.Dispatch("SldWorks.Application")
-    active_doc = sw_app.ActiveDoc
+    return win32com.client.Dispatch("SldWorks.Application")
+
+
+def _get_active_doc():
+    """Return the active SolidWorks document, re-dispatching if the cached app has gone away."""
+    import pywintypes
+    try:
+        active_doc = _get_sw_app().ActiveDoc
+    except pywintypes.com_error:
+        # SolidWorks was restarted (e.g. RPC_E_DISCONNECTED); drop the stale handle and retry once.
+        _get_sw_app.cache_clear()
+        active_doc = _get_sw_app().ActiveDoc
     if active_doc is None:
         raise RuntimeError("No active SolidWorks document found.")
-    return _get_doc_title(active_doc)
+    return active_doc
+
+
+def get_active_document_name():
+    """Get the name of the active document in SolidWorks."""
+    return _get_doc_title(_get_active_doc())
 
 
 def get_active_assembly_and_configuration():
     """Get active assembly name and active configuration name."""
-    import win32com.client
-
-    sw_app = win32com.client.Dispatch("SldWorks.Application")
-    active_doc = sw_app.ActiveDoc
-    if active_doc is None:
-        raise RuntimeError("No active SolidWorks document found.")
+    active_doc = _get_active_doc()
 
     # swDocumentTypes_e.swDocASSEMBLY == 2
     doc_type = _get_doc_type(active_doc)
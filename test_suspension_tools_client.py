@@ -0,0 +1,170 @@
+"""Tests for the SuspensionTools.exe daemon client, using a fake daemon process."""
+
+import io
+import subprocess
+import unittest
+from unittest import mock
+
+import suspension_tools_client
+from suspension_tools_client import CommandInterrupted, SuspensionToolsClient, run_tools_command
+
+
+class FakeStdin(io.StringIO):
+    def __init__(self, fail_write=False):
+        super().__init__()
+        self.fail_write = fail_write
+
+    def write(self, text):
+        if self.fail_write:
+            raise BrokenPipeError("pipe closed")
+        return super().write(text)
+
+
+class FakeDaemon:
+    """Stands in for a SuspensionTools.exe --daemon Popen; stdout replays the given lines."""
+
+    def __init__(self, *lines, fail_write=False):
+        self.stdin = FakeStdin(fail_write)
+        self.stdout = io.StringIO("".join(line + "\n" for line in lines))
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self.returncode = 0
+        return 0
+
+    def kill(self):
+        self.returncode = -9
+
+    def commands(self):
+        return [line.split("\t") for line in self.stdin.getvalue().splitlines()]
+
+
+class ClientTestCase(unittest.TestCase):
+    exe = "SuspensionTools.exe"
+
+    def setUp(self):
+        find = mock.patch.object(suspension_tools_client, "find_suspension_tools_exe",
+                                 side_effect=lambda: self.exe)
+        find.start()
+        self.addCleanup(find.stop)
+
+    def patch_popen(self, *daemons):
+        popen = mock.patch.object(suspension_tools_client.subprocess, "Popen", side_effect=list(daemons))
+        self.addCleanup(popen.stop)
+        return popen.start()
+
+
+class SuspensionToolsClientTest(ClientTestCase):
+
+    def test_returns_exit_code_and_output_before_done(self):
+        daemon = FakeDaemon("line one", "line two", "DONE:3")
+        self.patch_popen(daemon)
+
+        result = SuspensionToolsClient().run("vis", "all", "show")
+
+        self.assertEqual(result, (3, ["line one", "line two"]))
+        self.assertEqual(daemon.commands(), [["vis", "all", "show"]])
+
+    def test_reuses_one_daemon_for_several_commands(self):
+        daemon = FakeDaemon("DONE:0", "shown", "DONE:1")
+        popen = self.patch_popen(daemon)
+        client = SuspensionToolsClient()
+
+        self.assertEqual(client.run("vis", "front", "hide"), (0, []))
+        self.assertEqual(client.run("vis", "rear", 1.5), (1, ["shown"]))
+
+        self.assertEqual(popen.call_count, 1)
+        self.assertEqual(daemon.commands(), [["vis", "front", "hide"], ["vis", "rear", "1.5"]])
+
+    def test_rejects_tabs_and_newlines_without_starting_daemon(self):
+        popen = self.patch_popen()
+        client = SuspensionToolsClient()
+
+        with self.assertRaises(ValueError):
+            client.run("vis", "substring", "show", "a\tb")
+        with self.assertRaises(ValueError):
+            client.run("vis", "substring", "show", "a\nb")
+        popen.assert_not_called()
+
+    def test_build_without_daemon_mode_is_latched_unsupported(self):
+        # Older builds print their usage for --daemon and exit
+        popen = self.patch_popen(FakeDaemon("Usage:", "  SuspensionTools.exe ..."))
+        client = SuspensionToolsClient()
+
+        with self.assertRaises(OSError):
+            client.run("release")
+        with self.assertRaises(OSError):
+            client.run("release")
+        self.assertEqual(popen.call_count, 1)
+
+    def test_restarts_daemon_when_exe_path_changes(self):
+        first, second = FakeDaemon("DONE:0"), FakeDaemon("DONE:0")
+        popen = self.patch_popen(first, second)
+        client = SuspensionToolsClient()
+
+        client.run("release")
+        self.exe = "Rebuilt/SuspensionTools.exe"
+        client.run("release")
+
+        self.assertEqual([c.args[0][0] for c in popen.call_args_list],
+                         ["SuspensionTools.exe", "Rebuilt/SuspensionTools.exe"])
+        self.assertTrue(first.stdin.closed)
+        self.assertEqual(second.commands(), [["release"]])
+
+    def test_daemon_exiting_mid_command_raises_command_interrupted(self):
+        self.patch_popen(FakeDaemon("DONE:0", "partial output"))
+        client = SuspensionToolsClient()
+        client.run("release")
+
+        with self.assertRaises(CommandInterrupted) as cm:
+            client.run("FL_wheel", 1.0, 2.0, 3.0)
+        self.assertEqual(cm.exception.output, ["partial output"])
+
+
+class RunToolsCommandTest(ClientTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client = SuspensionToolsClient()
+        get_client = mock.patch.object(suspension_tools_client, "get_client", return_value=self.client)
+        get_client.start()
+        self.addCleanup(get_client.stop)
+        run = mock.patch.object(suspension_tools_client.subprocess, "run",
+                                return_value=subprocess.CompletedProcess([], 0, stdout="", stderr=""))
+        self.subprocess_run = run.start()
+        self.addCleanup(run.stop)
+
+    def test_command_interrupted_mid_run_is_not_repeated(self):
+        self.patch_popen(FakeDaemon("DONE:0"))
+        self.assertTrue(run_tools_command("release"))
+
+        with mock.patch("builtins.print"):
+            ok = run_tools_command("CHAS_upper_FRONT", 100.0, 200.0, 300.0)
+
+        self.assertFalse(ok)
+        self.subprocess_run.assert_not_called()
+
+    def test_write_failure_falls_back_to_one_off_process(self):
+        self.patch_popen(FakeDaemon(fail_write=True))
+
+        ok = run_tools_command("CHAS_upper_FRONT", 100.0, 200.0, 300.0)
+
+        self.assertTrue(ok)
+        self.assertEqual(self.subprocess_run.call_args[0][0],
+                         ["SuspensionTools.exe", "CHAS_upper_FRONT", "100.0", "200.0", "300.0"])
+
+    def test_unsupported_build_falls_back_to_one_off_process(self):
+        self.patch_popen(FakeDaemon("Usage:"))
+
+        with mock.patch("builtins.print"):
+            ok = run_tools_command("vis", "all", "hide")
+
+        self.assertTrue(ok)
+        self.subprocess_run.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,19 @@
 import os
 import sys
+import json
+import locale
+import mmap
+import tempfile
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Project root (this script's directory); computed once at import
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+# Where shipped resources live: next to the executable when packaged, else the project root
+RESOURCE_DIR = os.path.dirname(sys.executable) if getattr(sys, 'frozen', False) else APP_DIR
 
 
 def get_data_dir():
@@ -11,7 +25,7 @@ def get_data_dir():
     if getattr(sys, 'frozen', False):
         base = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'SolidworksOptKPlugin')
     else:
-        base = os.path.dirname(os.path.abspath(__file__))
+        base = APP_DIR
     os.makedirs(base, exist_ok=True)
     return base
 
@@ -23,17 +37,63 @@ def get_temp_dir():
     return temp
 
 
+def dir_has_files(dir_path, names):
+    """Return True if every name is a file in dir_path, using a single directory scan."""
+    try:
+        with os.scandir(dir_path) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return False
+    return present.issuperset(names)
+
+
 def get_resource_path(*parts):
     """Resolve a path to a read-only resource that ships with the app.
 
     Packaged builds: alongside sys.executable (where Inno Setup installs files).
     Dev builds:      relative to this script's directory (project root).
     """
-    if getattr(sys, 'frozen', False):
-        base = os.path.dirname(sys.executable)
-    else:
-        base = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base, *parts)
+    return os.path.join(RESOURCE_DIR, *parts)
+
+
+# Development build outputs searched by find_suspension_tools_exe
+SUSPENSION_TOOLS_BUILD_DIRS = [
+    os.path.join(APP_DIR, "sw_drawer", "bin", "Release", "net48"),
+    os.path.join(APP_DIR, "sw_drawer", "bin", "Debug", "net48"),
+    os.path.join(APP_DIR, "sw_drawer", "bin", "Release"),
+    os.path.join(APP_DIR, "sw_drawer", "bin", "Debug"),
+]
+SUSPENSION_TOOLS_EXE_NAMES = {"suspensiontools.exe", "sw_drawer.exe"}
+
+
+# (build folder mtimes, [(is SuspensionTools.exe, path), ...]) from the last scan
+_exe_scan_cache = None
+
+
+def _build_dir_mtimes():
+    """Return the mtime of each build folder (None if missing); adding or removing a file changes it."""
+    mtimes = []
+    for build_dir in SUSPENSION_TOOLS_BUILD_DIRS:
+        try:
+            mtimes.append(os.stat(build_dir).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _scan_build_dirs():
+    """List the SuspensionTools executables in the build folders, one scandir per folder."""
+    found = []
+    for build_dir in SUSPENSION_TOOLS_BUILD_DIRS:
+        try:
+            with os.scandir(build_dir) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if name in SUSPENSION_TOOLS_EXE_NAMES and entry.is_file():
+                        found.append((name == "suspensiontools.exe", entry.path))
+        except OSError:
+            continue
+    return found
 
 
 def find_suspension_tools_exe():
@@ -42,6 +102,8 @@ def find_suspension_tools_exe():
     Search order:
     1. Next to sys.executable (packaged PyInstaller build)
     2. Development build outputs, Release before Debug, newest mtime wins
+
+    The build folder listing is reused until one of the folders changes.
     """
     # Packaged build: SuspensionTools.exe ships alongside the Python exe.
     if getattr(sys, 'frozen', False):
@@ -49,25 +111,113 @@ def find_suspension_tools_exe():
         if os.path.exists(packaged):
             return packaged
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    paths_to_check = [
-        os.path.join(script_dir, "sw_drawer", "bin", "Release", "net48", "SuspensionTools.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Debug",   "net48", "SuspensionTools.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Release", "net48", "sw_drawer.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Debug",   "net48", "sw_drawer.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Release", "SuspensionTools.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Debug",   "SuspensionTools.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Release", "sw_drawer.exe"),
-        os.path.join(script_dir, "sw_drawer", "bin", "Debug",   "sw_drawer.exe"),
-    ]
-
-    existing = [p for p in paths_to_check if os.path.exists(p)]
-    if existing:
-        preferred = [p for p in existing if os.path.basename(p).lower() == "suspensiontools.exe"]
-        candidates = preferred if preferred else existing
-        return max(candidates, key=os.path.getmtime)
+    global _exe_scan_cache
+    folder_mtimes = _build_dir_mtimes()
+    if _exe_scan_cache is None or _exe_scan_cache[0] != folder_mtimes:
+        _exe_scan_cache = (folder_mtimes, _scan_build_dirs())
+
+    # Rebuilding in place changes the executable's mtime but not its folder's, so re-stat these
+    found = []  # (mtime, is SuspensionTools.exe, path)
+    for preferred, path in _exe_scan_cache[1]:
+        try:
+            found.append((os.stat(path).st_mtime, preferred, path))
+        except OSError:
+            continue
+
+    if found:
+        preferred = [f for f in found if f[1]]
+        candidates = preferred if preferred else found
+        return max(candidates, key=lambda f: f[0])[2]
 
     raise FileNotFoundError(
         "SuspensionTools.exe not found. Run 'dotnet build -c Release' in the sw_drawer folder.\n"
-        f"Searched: {paths_to_check[0]}"
+        f"Searched: {os.path.join(SUSPENSION_TOOLS_BUILD_DIRS[0], 'SuspensionTools.exe')}"
     )
+
+
+def read_json(file_path):
+    """Load a JSON file, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals that json.dump can emit.
+            pass
+    return json.loads(raw)
+
+
+def write_json(file_path, data, indent=False):
+    """Atomically write data as JSON, using orjson when it is installed.
+
+    Output is compact unless indent is true; use indent for files people open
+    or preview. Values JSON can't represent natively are written via str(). The
+    file is written to a temporary sibling and moved into place, so readers
+    never see a partial file.
+    """
+    payload = None
+    if orjson is not None:
+        # PASSTHROUGH_DATETIME keeps str() formatting for Excel date cells, as json.dump did.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            payload = orjson.dumps(data, default=str, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder handle them.
+            pass
+    if payload is None:
+        layout = {'indent': 2} if indent else {'separators': (',', ':')}
+        payload = json.dumps(data, ensure_ascii=False, default=str, **layout).encode('utf-8')
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def format_json(data):
+    """Return data as indented JSON text for display."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            # Same limits as write_json (e.g. integers wider than 64 bits).
+            pass
+    return json.dumps(data, indent=2)
+
+
+def read_text_head(file_path, max_bytes):
+    """Return up to max_bytes from the start of a file as text, via a read-only mmap."""
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:max_bytes].decode('utf-8', errors='replace')
+
+
+def iter_output_blocks(pipe, chunk_size=65536):
+    """Yield a subprocess's output as it arrives, as text blocks of complete lines.
+
+    pipe is a binary stdout from Popen (no text=True). Each read takes whatever
+    is available, so blocks hold as many lines as the process wrote since the
+    last read; an unterminated last line is yielded at EOF. Decodes with the
+    same locale encoding text-mode pipes use.
+    """
+    encoding = locale.getpreferredencoding(False)
+    partial = b""
+    while True:
+        chunk = pipe.read1(chunk_size)
+        if not chunk:
+            break
+        lines, _, partial = (partial + chunk).rpartition(b"\n")
+        if lines:
+            yield lines.decode(encoding, errors='replace')
+    if partial:
+        yield partial.decode(encoding, errors='replace')
@@ -1,7 +1,7 @@
 import os
-import subprocess
 from workers import WorkerBase
-from utils import find_suspension_tools_exe, get_data_dir
+from utils import get_data_dir, read_json, write_json
+from suspension_tools_client import run_tools_command
 
 
 class VisualizationWorker(WorkerBase):
@@ -19,8 +19,6 @@ class VisualizationWorker(WorkerBase):
 
 def set_suspension_visibility(target, visible, filter_text=None):
     """Set suspension visibility using SuspensionTools.exe."""
-    exe_path = find_suspension_tools_exe()
-    
     # Map target to command
     command_map = {
         'all': 'all',
@@ -37,25 +35,16 @@ def set_suspension_visibility(target, visible, filter_text=None):
     command = command_map.get(target, 'all')
     vis_str = 'show' if visible else 'hide'
     
-    args = [exe_path, 'vis', command, vis_str]
+    args = ['vis', command, vis_str]
     if filter_text:
         args.append(filter_text)
     
-    print(f"Running: {' '.join(args)}")
-    
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
-    
-    return result.returncode == 0
+    print(f"Running: SuspensionTools.exe {' '.join(args)}")
+    return run_tools_command(*args)
 
 
 def set_marker_visibility(target, visible, filter_text=None):
     """Set marker visibility using SuspensionTools.exe."""
-    exe_path = find_suspension_tools_exe()
-    
     # Map target to command
     command_map = {
         'all': 'all',
@@ -67,37 +56,22 @@ def set_marker_visibility(target, visible, filter_text=None):
     command = command_map.get(target, 'all')
     vis_str = 'show' if visible else 'hide'
     
-    args = [exe_path, 'marker', 'vis', command, vis_str]
+    args = ['marker', 'vis', command, vis_str]
     if filter_text:
         args.append(filter_text)
     
-    print(f"Running: {' '.join(args)}")
-    
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
-    
-    return result.returncode == 0
+    print(f"Running: SuspensionTools.exe {' '.join(args)}")
+    return run_tools_command(*args)
 
 
 def set_feature_visibility(feature_name, visible):
     """Set specific feature visibility."""
-    exe_path = find_suspension_tools_exe()
     vis_str = 'show' if visible else 'hide'
     
-    args = [exe_path, 'vis', 'feature', vis_str, feature_name]
-    
-    print(f"Running: {' '.join(args)}")
-    
-    result = subprocess.run(args, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.returncode != 0 and result.stderr:
-        print(result.stderr.strip())
+    args = ['vis', 'feature', vis_str, feature_name]
     
-    return result.returncode == 0
+    print(f"Running: SuspensionTools.exe {' '.join(args)}")
+    return run_tools_command(*args)
 
 
 def get_color_coding_info():
@@ -195,9 +169,7 @@ def create_visualization_profile(profile_name, settings):
         'created': __import__('datetime').datetime.now().isoformat()
     }
     
-    import json
-    with open(profile_path, 'w') as f:
-        json.dump(profile_data, f, indent=2)
+    write_json(profile_path, profile_data, indent=True)
     
     return profile_path
 
@@ -208,9 +180,7 @@ def load_visualization_profile(profile_name):
     profile_path = os.path.join(profiles_dir, f"{profile_name}.json")
     
     if os.path.exists(profile_path):
-        import json
-        with open(profile_path, 'r') as f:
-            return json.load(f)
+        return read_json(profile_path)
     return None
 
 
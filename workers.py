@@ -1,18 +1,102 @@
 import sys
-from PyQt5.QtCore import QThread, pyqtSignal, QObject
+import subprocess
+import threading
+import contextlib
+import contextvars
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 from solidworks_release import release_solidworks_command_state
 
 
-class QtStream(QObject):
-    """Redirect stdout to a PyQt signal."""
-    text_written = pyqtSignal(str)
+class LogBuffer:
+    """Thread-safe stdout replacement that the GUI thread drains on a timer.
+
+    write() never posts a Qt event; the owner polls drain(), so output is
+    batched without waiting for the writer to produce more.
+    Writes are split into whole lines; call flush() when the writer is done.
+    """
+
+    def __init__(self):
+        self._partial = ""  # only touched by the writing thread
+        self._lines = []
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        lines = [line for line in map(str.strip, lines) if line]
+        if lines:
+            with self._lock:
+                self._lines.extend(lines)
+
+    def writelines(self, lines):
+        self.write("".join(lines))
+
+    def flush(self):
+        partial, self._partial = self._partial.strip(), ""
+        if partial:
+            with self._lock:
+                self._lines.append(partial)
+
+    def drain(self):
+        """Return and clear the buffered lines, newline-joined ("" if none)."""
+        with self._lock:
+            lines, self._lines = self._lines, []
+        return "\n".join(lines)
+
+
+# Where print() output goes for the current thread; None means the real stdout
+_LOG_SINK = contextvars.ContextVar("_LOG_SINK", default=None)
+_router_lock = threading.Lock()
+
+
+class _StdoutRouter:
+    """sys.stdout replacement that writes to the current thread's log sink.
+
+    Installed once by capture_stdout(). Threads without a sink, including the
+    GUI thread, keep writing to the original stdout.
+    """
+
+    def __init__(self, default):
+        self._default = default
+
+    def _target(self):
+        sink = _LOG_SINK.get()
+        return self._default if sink is None else sink
 
     def write(self, text):
-        if text.strip():
-            self.text_written.emit(text.strip())
+        target = self._target()
+        if target is None:
+            # Windowed builds have no console; print() is a no-op there
+            return len(text)
+        return target.write(text)
+
+    def writelines(self, lines):
+        self.write("".join(lines))
 
     def flush(self):
-        pass
+        target = self._target()
+        if target is not None:
+            target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._default, name)
+
+
+@contextlib.contextmanager
+def capture_stdout(sink):
+    """Send print() output from the calling thread to sink for the duration of the block.
+
+    Unlike reassigning sys.stdout, this doesn't capture other threads' output,
+    so concurrent workers keep separate logs.
+    """
+    with _router_lock:
+        if not isinstance(sys.stdout, _StdoutRouter):
+            sys.stdout = _StdoutRouter(sys.stdout)
+    token = _LOG_SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _LOG_SINK.reset(token)
 
 
 class WorkerBase(QThread):
@@ -20,15 +104,27 @@ class WorkerBase(QThread):
 
     Subclasses set STATE_DESCRIPTIONS and SUCCESS_MESSAGE as class variables
     to customise per-operation state labels and the completion message.
+
+    The operation's print() output goes to a LogBuffer that a GUI-thread timer
+    drains every LOG_POLL_MS, so log, progress and state signals are emitted
+    from the GUI thread in batches.
     """
     finished = pyqtSignal(bool, str)
     progress = pyqtSignal(int, int)   # current, total
     state_changed = pyqtSignal(str)   # human-readable state description
     log = pyqtSignal(str)
+    _done = pyqtSignal(bool, str)     # from run(); finished follows the last log drain
 
-    STATE_DESCRIPTIONS: dict = {}
+    STATE_DESCRIPTIONS: dict = {
+        "Initializing": "Starting...",
+        "Complete": "Done",
+    }
     SUCCESS_MESSAGE: str = "Operation completed successfully"
 
+    ABORT_POLL_MS = 200
+    ABORT_KILL_AFTER_MS = 2000
+    LOG_POLL_MS = 100
+
     def __init__(self, operation, *args):
         super().__init__()
         self.operation = operation
@@ -37,68 +133,148 @@ class WorkerBase(QThread):
         self._process = None
         self._total_tasks = 0
         self._current_progress = 0
+        self._progress_changed = False  # emitted once per log batch by _handle_log
+        self.output = LogBuffer()
+        # Created on the GUI thread, so it fires there while run() is busy
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_POLL_MS)
+        self._log_timer.timeout.connect(self._drain_log)
+        self._done.connect(self._on_done)
+
+    def start(self, *args, **kwargs):
+        self._log_timer.start()
+        super().start(*args, **kwargs)
 
     def abort(self):
-        """Request abort and terminate any running subprocess."""
+        """Request abort and terminate any running subprocess.
+
+        Called from the GUI thread, so the subprocess is polled on a timer
+        rather than waited on; it is killed if still running after
+        ABORT_KILL_AFTER_MS. SolidWorks is released by run() on the worker
+        thread once the operation has returned.
+        """
         self._abort = True
-        if self._process and self._process.poll() is None:
+        process = self._process
+        if process is None:
+            return
+        if process.poll() is None:
             try:
-                self._process.terminate()
-                self._process.wait(timeout=2)
-            except:
-                try:
-                    self._process.kill()
-                except:
-                    pass
-
-        if self._process is not None:
-            released, release_message = release_solidworks_command_state()
-            if not released:
-                print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
+                process.terminate()
+            except OSError:
+                pass
+        QTimer.singleShot(self.ABORT_POLL_MS, lambda: self._check_terminated(process, self.ABORT_POLL_MS))
 
-    def parse_output_line(self, line):
-        """Parse TOTAL:/PROGRESS:/STATE: protocol lines; return None to suppress from log."""
-        if line.startswith("TOTAL:"):
+    def _check_terminated(self, process, waited):
+        """Timer callback for abort(): kill the subprocess if it ignores terminate()."""
+        if process.poll() is None:
+            if waited < self.ABORT_KILL_AFTER_MS:
+                waited += self.ABORT_POLL_MS
+                QTimer.singleShot(self.ABORT_POLL_MS, lambda: self._check_terminated(process, waited))
+                return
             try:
-                self._total_tasks = int(line.split(":")[1])
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
+                process.kill()
+            except OSError:
                 pass
-            return None
-        elif line.startswith("PROGRESS:"):
+
+    def stop(self):
+        """Abort and block until the thread has exited; return False if it is still running.
+
+        For application shutdown, when abort()'s timer would never fire. run()
+        releases SolidWorks on the worker thread as it exits.
+        """
+        self._abort = True
+        self._end_process()
+        return self.wait(self.ABORT_KILL_AFTER_MS)
+
+    def _end_process(self):
+        """Terminate the subprocess, killing it if it outlives ABORT_KILL_AFTER_MS. Blocks."""
+        process = self._process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.terminate()
+            process.wait(timeout=self.ABORT_KILL_AFTER_MS / 1000)
+        except (OSError, subprocess.TimeoutExpired):
             try:
-                self._current_progress = int(line.split(":")[1])
-                self.progress.emit(self._current_progress, self._total_tasks)
-            except:
+                process.kill()
+            except OSError:
                 pass
-            return None
-        elif line.startswith("STATE:"):
-            state = line.split(":")[1]
-            description = self.STATE_DESCRIPTIONS.get(state, state)
-            self.state_changed.emit(description)
-            return None
-        return line
 
-    def run(self):
-        stream = QtStream()
-        stream.text_written.connect(self._handle_log)
-        old_stdout = sys.stdout
-        sys.stdout = stream
+    @staticmethod
+    def _release_solidworks():
+        released, release_message = release_solidworks_command_state()
+        if not released:
+            print(f"Warning: Failed to release SolidWorks state after abort: {release_message}")
+
+    def _on_total(self, value):
         try:
-            self.operation(*self.args, worker=self)
-            if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(True, self.SUCCESS_MESSAGE)
-        except Exception as e:
+            self._total_tasks = int(value)
+        except ValueError:
+            return
+        self._progress_changed = True
+
+    def _on_progress(self, value):
+        try:
+            self._current_progress = int(value)
+        except ValueError:
+            return
+        self._progress_changed = True
+
+    def _on_state(self, value):
+        self.state_changed.emit(self.STATE_DESCRIPTIONS.get(value, value))
+
+    # Protocol keyword -> handler, looked up once per line instead of a startswith chain
+    _PROTOCOL_HANDLERS = {
+        "TOTAL": _on_total,
+        "PROGRESS": _on_progress,
+        "STATE": _on_state,
+    }
+
+    def parse_output_line(self, line):
+        """Parse TOTAL:/PROGRESS:/STATE: protocol lines; return None to suppress from log."""
+        keyword, sep, value = line.partition(":")
+        handler = self._PROTOCOL_HANDLERS.get(keyword) if sep else None
+        if handler is None:
+            return line
+        handler(self, value.split(":", 1)[0])
+        return None
+
+    def run(self):
+        with capture_stdout(self.output):
+            try:
+                self.operation(*self.args, worker=self)
+                success, message = True, self.SUCCESS_MESSAGE
+            except Exception as e:
+                success, message = False, str(e)
             if self._abort:
-                self.finished.emit(False, "Operation aborted")
-            else:
-                self.finished.emit(False, str(e))
-        finally:
-            sys.stdout = old_stdout
+                success, message = False, "Operation aborted"
+                # Release here, once, so the GUI thread never blocks on it and it
+                # finishes before finished lets a new operation start
+                self._end_process()
+                self._release_solidworks()
+        self.output.flush()
+        self._done.emit(success, message)
+
+    def _on_done(self, success, message):
+        """GUI-thread slot for run()'s completion: log the remaining output, then report."""
+        self._log_timer.stop()
+        self._drain_log()
+        self.finished.emit(success, message)
+
+    def _drain_log(self):
+        text = self.output.drain()
+        if text:
+            self._handle_log(text)
 
     def _handle_log(self, text):
-        result = self.parse_output_line(text)
-        if result is not None:
-            self.log.emit(result)
+        """Handle a batch of log lines, parsing special lines.
+
+        Progress lines in the batch collapse into one progress signal carrying
+        the latest values.
+        """
+        lines = [line for line in map(self.parse_output_line, text.split("\n")) if line is not None]
+        if self._progress_changed:
+            self._progress_changed = False
+            self.progress.emit(self._current_progress, self._total_tasks)
+        if lines:
+            self.log.emit("\n".join(lines))